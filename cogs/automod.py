@@ -1,7 +1,7 @@
 import discord
 from core import Client
 from core.view import DesignerView
-from db.funcs.guild import fetch_guild_settings, set_autorole
+from db.funcs.guild import cached_guild_settings, fetch_guild_settings, set_autorole
 from discord import ui
 from discord.ext import commands
 from utils import config
@@ -18,7 +18,10 @@ class AutoMod(commands.Cog):
         if msg.author.bot:
             return
 
-        guild_settings = await fetch_guild_settings(msg.guild.id)
+        # Read from memory: guilds without a cached row have no media-only channel set.
+        guild_settings = cached_guild_settings(msg.guild.id)
+        if guild_settings is None:
+            return
         media_only_channel_id = guild_settings.media_only_channel_id
 
         if msg.channel.id == media_only_channel_id:
@@ -21,7 +21,8 @@ from discord.commands import SlashCommandGroup, option, slash_command
 from discord.ext import commands
 from discord.ui import ActionRow
 from io import BytesIO
-from music.core import fetch_node_info
+from music import cache
+from music.nodes import fetch_node_info
 from typing import Literal
 from utils import check, config, temp
 from utils.emoji import Emoji, emoji, reload_emoji, update_emoji
@@ -290,6 +291,7 @@ class StatsView(DesignerView):
             ("Members", f"{sum(1 for _ in self.client.get_all_members()):,}"),
             ("Channels", f"{sum(1 for _ in self.client.get_all_channels()):,}"),
             ("Voice", f"{len(self.client.voice_clients):,}"),
+            ("Track Cache", f"{cache.resolve_stats['hits']:,} hits / {cache.resolve_stats['misses']:,} misses"),
         ]
         return ["BOT", *Term.kv(rows), "", *self._chart("Latency (ms)", self._track("latency", latency))]
 
@@ -605,6 +607,7 @@ class Devs(commands.Cog):
         temp.set("restart_msg", {"channel_id": msg.channel.id, "id": (await msg.original_message()).id})
         await self.client.wait_until_ready()
         await self.client.close()
+        await temp.flush()
         os.system("clear")
         os.execv(sys.executable, [sys.executable] + sys.argv)
 
@@ -619,9 +622,8 @@ class Devs(commands.Cog):
             )
         )
         await ctx.respond(view=view, ephemeral=True, delete_after=2)
-        for filename in os.listdir("./cogs"):
-            if filename.endswith(".py"):
-                self.client.reload_extension(f"cogs.{filename[:-3]}")
+        for extension in list(self.client.extensions):  # Deferred lazy cogs aren't loaded yet
+            self.client.reload_extension(extension)
 
     # Shutdown
     @slash_command(guild_ids=config.owner_guild_ids, name="shutdown")
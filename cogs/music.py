@@ -4,24 +4,31 @@ import discord
 import math
 import re
 import sonolink
+import time
 from babel.dates import format_timedelta
 from core import Client
 from core.view import DesignerView
 from discord import SlashCommandGroup, ui
 from discord.commands import option, slash_command
 from discord.ext import commands
-from music import store
+from music import cache, nodes, sessions, store
 from music.core import (
     SquarePlayer,
-    fetch_node_info,
     fmt_time,
     get_player,
-    register_nodes,
     requester_id,
-    tag_requester,
 )
 from music.filters import EqPresets
-from music.player import cleanup_guild, render_player, skip_or_stop, slash_log, start_lyrics, stop_player
+from music.player import (
+    cleanup_guild,
+    close_scheduler,
+    render_player,
+    skip_or_stop,
+    slash_log,
+    start_lyrics,
+    start_scheduler,
+    stop_player,
+)
 from music.queue import QueueListView
 from music.utils import container, get_source, music_log, reply
 from rich.console import Console
@@ -45,11 +52,19 @@ class Music(commands.Cog):
     chars_per_line = 60
     # Relocate the player once this many estimated chat lines have stacked below it.
     relocate_lines = 10
+    # Playlist tracks tagged & queued per event loop turn, playlists longer than this report progress as they're added.
+    ingest_chunk = 200
+    # Minimum seconds between playlist progress edits.
+    ingest_progress_interval = 2.0
 
     def __init__(self, client: Client):
         self.client = client
         self._node_live: Live | None = None
-        register_nodes(client)
+        self._autosave: asyncio.Task | None = None
+        self._balancer: asyncio.Task | None = None
+        nodes.register_nodes(client)
+        if any(node.is_connected for node in client.sonolink.nodes):
+            self._start_tasks()  # Reloaded with nodes already up, node_ready won't fire again
 
     # Console spinner helpers
     def _start_spinner(self, text: str):
@@ -77,7 +92,7 @@ class Music(commands.Cog):
     @commands.Cog.listener()
     async def on_sonolink_node_ready(self, event: sonolink.gateway.ReadyEvent):
         node = event.node
-        _, latency = await fetch_node_info(node)
+        _, latency = await nodes.fetch_node_info(node)
         text = Text()
         text.append("✓ Connected to Lavalink ", style="green")
         text.append(node.id, style="cyan")
@@ -88,6 +103,43 @@ class Music(commands.Cog):
         text.append(": ")
         text.append(str(event.resumed), style="cyan")
         self._finish_spinner(text)
+        self._start_tasks()
+        # Resume the sessions saved before the last shutdown, a no-op after the first node of the process
+        await self.client.wait_until_ready()
+        resumed = await sessions.restore(self.client)
+        if resumed:
+            console.print(f"[green]✓ Resumed [cyan]{resumed}[/] player session{'s' if resumed != 1 else ''}[/]")
+
+    def _start_tasks(self):
+        """Starts the periodic session snapshots & node balancing, once per cog instance, & the lyrics scheduler."""
+        start_scheduler()
+        if self._autosave is None:
+            self._autosave = asyncio.create_task(sessions.autosave(self.client))
+        if self._balancer is None:
+            self._balancer = asyncio.create_task(self._balance_nodes())
+
+    async def _balance_nodes(self):
+        """Probes the nodes & moves players off degraded ones every :data:`nodes.PROBE_INTERVAL` seconds."""
+        while True:
+            await asyncio.sleep(nodes.PROBE_INTERVAL)
+            try:
+                await nodes.probe(self.client)
+                moves = await nodes.rebalance(self.client)
+            except Exception:
+                console.print("[red bold]Failed to balance Lavalink nodes[/]")
+                console.print_exception()
+                continue
+            for node_id, moved in moves.items():
+                text = Text()
+                text.append("↻ Moved ", style="yellow")
+                text.append(str(moved), style="cyan")
+                text.append(f" player{'s' if moved != 1 else ''} off degraded Lavalink node ", style="yellow")
+                text.append(node_id, style="cyan")
+                console.print(text)
+
+    @commands.Cog.listener()
+    async def on_shutdown(self):
+        sessions.save(self.client)
 
     @commands.Cog.listener()
     async def on_sonolink_node_close(self, node: sonolink.Node):
@@ -110,13 +162,15 @@ class Music(commands.Cog):
         track = player.current
         if track is None:
             return
-        relocate = store.chat_weight(guild_id) > 0
+        state = store.get(guild_id)
+        relocate = state is not None and state.chat_weight > 0
         if relocate:
-            pending = store.render_task(guild_id)
+            pending = state.render_task
             if pending and not pending.done():
                 # This render supersedes the scheduled relocation - let it not fire a second send right after.
                 pending.cancel()
-        coros = [render_player(self.client, guild_id, force_new=relocate)]
+        render_player(self.client, guild_id, force_new=relocate)
+        coros = []
         if player.channel is not None:
             coros.append(player.channel.set_status(status=f"Playing **{track.title}**"))
         if track.autoplay:
@@ -178,6 +232,11 @@ class Music(commands.Cog):
 
     # Unloading cog
     def cog_unload(self):
+        for task in (self._autosave, self._balancer):
+            if task:
+                task.cancel()
+        asyncio.create_task(close_scheduler())
+        sessions.save(self.client)
         if self._node_live and self._node_live.is_started:
             self._node_live.stop()
             self._node_live = None
@@ -214,7 +273,7 @@ class Music(commands.Cog):
                 if ctx.guild.voice_client:
                     await ctx.guild.voice_client.disconnect(force=True)
                 player = await ctx.author.voice.channel.connect(cls=SquarePlayer)
-                store.play_ch(ctx.guild.id, ctx.channel, "set")
+                store.register(ctx.guild.id).play_ch = ctx.channel
             elif ctx.author.voice.channel != bot_channel:
                 await ctx.respond(view=_err(f"{emoji.error} You are not in my voice channel."), ephemeral=True)
                 return None
@@ -232,11 +291,15 @@ class Music(commands.Cog):
 
     # Search autocomplete
     async def search(self, ctx: discord.AutocompleteContext):
-        """Searches a track from a given query."""
-        tracks = []
+        """Searches a track from a given query, served from the autocomplete cache when possible."""
         if re.match(self.url_rx, ctx.value):
-            return tracks
-        query = ctx.value if ctx.value != "" else "top tracks"
+            return []
+        query = cache.normalize(ctx.value) or "top tracks"
+        return await cache.autocomplete(ctx.interaction.user.id, query, self._search_choices)
+
+    async def _search_choices(self, query: str) -> list[str]:
+        """Searches a query & formats the results as autocomplete choices."""
+        tracks = []
         result = await self.client.sonolink.search_track(query, source=sonolink.TrackSourceType.YOUTUBE_MUSIC)
         if result.is_error() or result.is_empty() or result.result is None:
             return tracks
@@ -286,21 +349,22 @@ class Music(commands.Cog):
         if message.author.id == self.client.user.id:
             # Own messages never hide the card: log toasts self-delete in 5s and the card itself is exempt.
             return
-        play_msg, _ = store.play_msg(message.guild.id)
-        if not play_msg or message.channel.id != play_msg.channel.id:
+        state = store.get(message.guild.id)
+        if not state or not state.play_msg or message.channel.id != state.play_msg.channel.id:
             return
-        if store.chat_weight(message.guild.id, self._visual_lines(message), "add") < self.relocate_lines:
+        state.chat_weight += self._visual_lines(message)
+        if state.chat_weight < self.relocate_lines:
             return
-        pending = store.render_task(message.guild.id)
+        pending = state.render_task
         if pending and not pending.done():
             # A relocation is already scheduled - let it fire instead of pushing it back on every message.
             return
 
         async def _relocate(guild_id: int = message.guild.id):
             await asyncio.sleep(2)
-            await render_player(self.client, guild_id, force_new=True)
+            render_player(self.client, guild_id, force_new=True)
 
-        store.render_task(message.guild.id, asyncio.create_task(_relocate()), mode="set")
+        state.render_task = asyncio.create_task(_relocate())
 
     @classmethod
     def _visual_lines(cls, message: discord.Message) -> int:
@@ -311,6 +375,48 @@ class Music(commands.Cog):
         blocks = len(message.attachments) + len(message.embeds) + len(message.stickers)
         return lines + blocks * cls.block_lines
 
+    async def _ingest_playlist(
+        self, ctx: discord.ApplicationContext, player: SquarePlayer, resolved: cache.Resolved
+    ) -> None:
+        """
+        Appends a playlist's tracks after the first in chunks & reports progress on the response message.
+
+        The loop is yielded between chunks so huge playlists don't stall it. Stops early if the player is torn down
+        mid-way.
+        """
+        name, total = resolved.playlist.name, len(resolved.tracks)
+        src_info = get_source(resolved.tracks[0].info.source_name)
+        color = int(src_info["color"])
+        queued = 1
+        message = None
+        if total > self.ingest_chunk:
+            message = await ctx.respond(
+                view=container(f"{src_info['emoji']} Adding **{name}**... `{queued}/{total}` tracks queued.", color)
+            )
+        last_edit = time.monotonic()
+        for start in range(1, total, self.ingest_chunk):
+            if get_player(self.client, ctx.guild.id) is not player:
+                break  # Stopped while adding, drop the rest
+            chunk = resolved.tracks[start : start + self.ingest_chunk]
+            player.queue.put(player.tag_requester(chunk, ctx.author.id, resolved.playlist))
+            queued += len(chunk)
+            if message and queued < total and time.monotonic() - last_edit >= self.ingest_progress_interval:
+                last_edit = time.monotonic()
+                try:
+                    await message.edit(
+                        view=container(
+                            f"{src_info['emoji']} Adding **{name}**... `{queued}/{total}` tracks queued.", color
+                        )
+                    )
+                except discord.HTTPException:
+                    pass
+            await asyncio.sleep(0)
+        view = container(f"{src_info['emoji']} Added **{name}** with `{queued}` tracks.", color)
+        if message:
+            await message.edit(view=view)
+        else:
+            await ctx.respond(view=view)
+
     # Play
     @slash_command(name="play")
     @option("query", description="Enter your track name/link or playlist link", autocomplete=search)
@@ -324,8 +430,8 @@ class Music(commands.Cog):
         try:
             query = query.strip("<>")
             query = re.sub(r"\b\d{1,2}:\d{2}(?::\d{2})?\b|\s*-\s*\d{1,2}:\d{2}(?::\d{2})?\b", "", query)
-            result = await self.client.sonolink.search_track(query, source=sonolink.TrackSourceType.YOUTUBE_MUSIC)
-            if result.is_error():
+            resolved = await cache.resolve(self.client.sonolink, query, sonolink.TrackSourceType.YOUTUBE_MUSIC)
+            if resolved is None:
                 await ctx.respond(
                     view=container(
                         f"{emoji.error} Failed to load the track. Please try again in a moment.",
@@ -335,28 +441,27 @@ class Music(commands.Cog):
                 if just_connected:
                     await stop_player(player, ctx.guild)
                 return
-            if result.is_empty() or result.result is None:
+            if not resolved.tracks:
                 await ctx.respond(
                     view=container(f"{emoji.error} No track found from the given query.", config.color.red)
                 )
                 if just_connected:
                     await stop_player(player, ctx.guild)
                 return
-            data = result.result
-            if isinstance(data, Playlist):
-                tracks = [tag_requester(self.client, track, ctx.author.id) for track in data.tracks]
-                src_info = get_source(tracks[0].source_name)
-                player.queue.put(tracks)
-                content = f"{src_info['emoji']} Added **{data.name}** with `{len(tracks)}` tracks."
+            if resolved.playlist is not None:
+                player.queue.put(player.tag_requester(resolved.tracks[0], ctx.author.id, resolved.playlist))
+                if not player.current:
+                    await player.play(player.queue.get())
+                await self._ingest_playlist(ctx, player, resolved)
+                return
+            [track] = player.tag_requester(resolved.tracks[0], ctx.author.id)
+            player.queue.put(track)
+            src_info = get_source(track.source_name)
+            if track.is_stream:
+                dur = f"{emoji.live} LIVE"
             else:
-                track = tag_requester(self.client, data[0] if isinstance(data, list) else data, ctx.author.id)
-                player.queue.put(track)
-                src_info = get_source(track.source_name)
-                if track.is_stream:
-                    dur = f"{emoji.live} LIVE"
-                else:
-                    dur = format_timedelta(datetime.timedelta(milliseconds=track.length), locale="en")
-                content = f"{src_info['emoji']} Added [**{track.title}** by **{track.author}**]({track.uri}) [{dur}]."
+                dur = format_timedelta(datetime.timedelta(milliseconds=track.length), locale="en")
+            content = f"{src_info['emoji']} Added [**{track.title}** by **{track.author}**]({track.uri}) [{dur}]."
             await ctx.respond(view=container(content, int(src_info["color"])))
             if not player.current:
                 await player.play(player.queue.get())
@@ -419,6 +524,7 @@ class Music(commands.Cog):
         player = await self.ensure_voice(ctx)
         if player:
             player.presets[kind] = EqPresets.build(kind, variant)
+            player.preset_variants[kind] = variant
             await player.apply_presets()
             await slash_log(ctx, f"{emoji.equalizer} Applied **{label}** ({variant}) equalizer.")
 
@@ -428,6 +534,7 @@ class Music(commands.Cog):
         player = await self.ensure_voice(ctx)
         if player:
             player.presets.clear()
+            player.preset_variants.clear()
             await player.apply_presets()
             await slash_log(ctx, f"{emoji.equalizer} Reset equalizer to default settings.")
 
@@ -447,6 +554,7 @@ class Music(commands.Cog):
             key = name.lower()
             if key in player.presets:
                 player.presets.pop(key)
+                player.preset_variants.pop(key, None)
                 await player.apply_presets()
                 await slash_log(ctx, f"{emoji.equalizer} Removed **{name.title()}** equalizer.")
             else:
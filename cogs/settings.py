@@ -8,7 +8,13 @@ from db.funcs.guild import (
     set_media_only,
     set_ticket_cmds,
 )
-from db.funcs.logs import fetch_log_channels, remove_log_channel, set_all_log_channels, set_log_channel
+from db.funcs.logs import (
+    fetch_log_channels,
+    forget_guild,
+    remove_log_channel,
+    set_all_log_channels,
+    set_log_channel,
+)
 from discord import ui
 from discord.commands import SlashCommandGroup, option, slash_command
 from discord.ext import commands
@@ -63,6 +69,7 @@ class SettingsCommand:
         match setting.lower():
             case "all":
                 await remove_guild(self.ctx.guild.id)
+                forget_guild(self.ctx.guild.id)  # Log channels cascade with the guild row
             case "all logs":
                 await remove_log_channel(self.ctx.guild.id)
             case "ticket commands":
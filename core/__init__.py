@@ -1,5 +1,7 @@
+import asyncio
 import discord
 import sonolink
+from core.lazy import LazyCogs
 from core.view import DesignerView
 from discord import ui
 from discord.ext import commands
@@ -17,12 +19,38 @@ class Client(commands.Bot):
     Attributes:
         allowed_mentions (:class:`discord.AllowedMentions`): Specifies which mentions are allowed in messages sent by the bot.
         sonolink (:class:`sonolink.Client`): An instance of the Sonolink client for handling music playback and related features.
+        lazy (:class:`LazyCogs`): Loader for the cogs configured to import on first use.
     """
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.allowed_mentions = discord.AllowedMentions().none()
         self.sonolink: sonolink.Client = sonolink.Client(self)
+        self.lazy = LazyCogs(self, config.lazy_cogs)
+
+    async def sync_commands(self, *args, **kwargs):
+        if self.lazy.pending:
+            # Deferred cogs' commands aren't registered locally; upsert individually & keep them alive as stubs.
+            kwargs.update(method="individual", delete_existing=False)
+        await super().sync_commands(*args, **kwargs)
+
+    async def on_unknown_application_command(self, interaction: discord.Interaction):
+        name = self.lazy.app_commands.get(interaction.data.get("name"))
+        if name and self.lazy.load(name):
+            await self.process_application_commands(interaction, auto_sync=False)
+
+    async def process_commands(self, message: discord.Message):
+        if self.lazy.prefix_commands and message.content:
+            name = self.lazy.prefix_commands.get(message.content.split(maxsplit=1)[0])
+            if name:
+                self.lazy.load(name)
+        await super().process_commands(message)
+
+    async def close(self):
+        if not self.is_closed():
+            # Run `on_shutdown` listeners to completion before voice clients are torn down, so cogs can snapshot state.
+            await asyncio.gather(*(listener() for listener in self.extra_events.get("on_shutdown", [])))
+        await super().close()
 
     async def on_ready(self):
         console.print(f"[green]✓ Logged in as [cyan]{self.user}[/]")
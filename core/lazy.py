@@ -0,0 +1,129 @@
+import json
+import os
+from discord.ext import commands
+
+manifest_path = "./.cache/cogs.json"
+
+# Events every boot dispatches, a lazy cog listening for any of them is loaded on boot instead of deferred.
+startup_events = frozenset({"on_ready", "on_connect", "on_shard_ready", "on_shard_connect"})
+
+
+class LazyCogs:
+    """
+    Defers importing the configured cogs until one of their commands or listeners is first used.
+
+    Each lazy cog's command & listener names are recorded in a manifest whenever it loads. On later boots a cog with
+    a manifest entry isn't imported at all: its slash commands stay registered with Discord as stubs, and the first
+    interaction, prefix command or event aimed at it loads the cog and replays that trigger to it.
+    Cogs without a manifest entry yet, or with listeners for startup events (:data:`startup_events`), are loaded
+    eagerly, since deferring them would make them miss those events.
+
+    Args:
+        client (:class:`commands.Bot`): The bot client.
+        names (list[str]): The cog module names (e.g. `"devs"`) to load lazily.
+    """
+
+    def __init__(self, client: commands.Bot, names: list[str]):
+        self.client = client
+        self.names = set(names)
+        self.manifest: dict[str, dict[str, list[str]]] = self._read()
+        self.deferred: dict[str, list[tuple[str, object]]] = {}  # Cog name -> its stub listeners
+        self.app_commands: dict[str, str] = {}  # Slash command name -> cog name
+        self.prefix_commands: dict[str, str] = {}  # Prefix command name -> cog name
+
+    @staticmethod
+    def _read() -> dict:
+        try:
+            with open(manifest_path) as f:
+                return json.load(f)
+        except FileNotFoundError, json.JSONDecodeError:
+            return {}
+
+    def _write(self) -> None:
+        os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+        with open(manifest_path, "w") as f:
+            json.dump(self.manifest, f, indent=4)
+
+    @property
+    def pending(self) -> bool:
+        """Whether any lazy cog is still deferred."""
+        return bool(self.deferred)
+
+    def deferrable(self, name: str) -> bool:
+        """Whether a cog is configured as lazy, has a manifest entry to register stubs from & no startup listeners."""
+        if name not in self.names or name not in self.manifest:
+            return False
+        return startup_events.isdisjoint(self.manifest[name]["listeners"])
+
+    def defer(self, name: str) -> bool:
+        """
+        Registers stubs for a lazy cog instead of loading it. Returns False if the cog can't be deferred.
+
+        Args:
+            name (str): The cog module name.
+        """
+        if not self.deferrable(name):
+            return False
+        entry = self.manifest[name]
+        self.app_commands.update(dict.fromkeys(entry["app_commands"], name))
+        self.prefix_commands.update(dict.fromkeys(entry["commands"], name))
+        stubs = []
+        for event in entry["listeners"]:
+            stub = self._stub(name, event)
+            self.client.add_listener(stub, event)
+            stubs.append((event, stub))
+        self.deferred[name] = stubs
+        return True
+
+    def _stub(self, name: str, event: str):
+        async def listener(*args):
+            # The cog's own listeners weren't registered when this event was dispatched, so replay it to them once loaded.
+            self.load(name)
+            for cog in self._cogs(name):
+                for cog_event, method in cog.get_listeners():
+                    if cog_event == event:
+                        await method(*args)
+
+        return listener
+
+    def _cogs(self, name: str) -> list[commands.Cog]:
+        """Returns the loaded cogs defined in a cog module."""
+        module = f"cogs.{name}"
+        return [cog for cog in self.client.cogs.values() if type(cog).__module__ == module]
+
+    def load(self, name: str) -> bool:
+        """
+        Loads a deferred cog & drops its stubs. Returns False if it was already loaded.
+
+        Args:
+            name (str): The cog module name.
+        """
+        stubs = self.deferred.pop(name, None)
+        if stubs is None:
+            return False
+        for event, stub in stubs:
+            self.client.remove_listener(stub, event)
+        self.app_commands = {cmd: cog for cmd, cog in self.app_commands.items() if cog != name}
+        self.prefix_commands = {cmd: cog for cmd, cog in self.prefix_commands.items() if cog != name}
+        self.client.load_extension(f"cogs.{name}")
+        self.record(name)
+        return True
+
+    def record(self, name: str) -> None:
+        """
+        Records a loaded lazy cog's command & listener names in the manifest.
+
+        Args:
+            name (str): The cog module name.
+        """
+        if name not in self.names:
+            return
+        entry = {"app_commands": [], "commands": [], "listeners": []}
+        for cog in self._cogs(name):
+            for command in cog.get_commands():
+                key = "commands" if isinstance(command, commands.Command) else "app_commands"
+                entry[key].append(command.name)
+            entry["listeners"] += [event for event, _ in cog.get_listeners() if event not in entry["listeners"]]
+        if self.manifest.get(name) != entry:
+            self.manifest[name] = entry
+            self._write()
@@ -1,34 +1,126 @@
+import os
+import re
+import time
 from aerich import Command
+from db.funcs import dev, guild, logs
 from rich.progress import Progress, SpinnerColumn
-from tortoise import Tortoise  # kept for close_connections
-from utils.config import db_url
+from tortoise import Tortoise, connections  # Tortoise kept for close_connections
+from tortoise.backends.base.config_generator import expand_db_url
+from tortoise.exceptions import OperationalError
+from utils.config import database, db_url
+
+MIGRATIONS_DIR = "./migrations"
+# Aerich migration file name, e.g. 1_20250101120000_init.py
+_migration_rx = re.compile(r"^\d+_.*\.py$")
+
+
+def _connection() -> dict:
+    """Expands the database URL into connection credentials carrying the configured pool settings."""
+    conn = expand_db_url(db_url)
+    conn["credentials"].update(
+        minsize=database.pool_min_size,
+        maxsize=database.pool_max_size,
+        command_timeout=database.command_timeout,
+        statement_cache_size=database.statement_cache_size,
+    )
+    return conn
+
 
 TORTOISE_ORM = {
     "connections": {
-        "default": db_url,
+        "default": _connection(),
     },
     "apps": {"models": {"models": ["db.schema", "aerich.models"], "default_connection": "default"}},
 }
 
 
+def _local_head(app: str = "models") -> str | None:
+    """Returns the newest migration file in the local migrations directory, or None if there are none."""
+    try:
+        files = [file for file in os.listdir(os.path.join(MIGRATIONS_DIR, app)) if _migration_rx.match(file)]
+    except FileNotFoundError:
+        return None
+    return max(files, key=lambda file: int(file.split("_", 1)[0])) if files else None
+
+
+async def _applied_head(app: str = "models") -> str | None:
+    """Returns the last migration aerich applied to the database, or None on a fresh database."""
+    conn = connections.get("default")
+    try:
+        rows = await conn.execute_query_dict(
+            "SELECT version FROM aerich WHERE app = $1 ORDER BY id DESC LIMIT 1", [app]
+        )
+    except OperationalError:
+        return None  # The aerich table doesn't exist yet
+    return rows[0]["version"] if rows else None
+
+
+async def _schema_present(app: str = "models") -> bool:
+    """Returns whether every model table exists, so a database without aerich history isn't mistaken for a fresh one."""
+    conn = connections.get("default")
+    tables = [model._meta.db_table for model in Tortoise.apps[app].values() if model._meta.db_table != "aerich"]
+    rows = await conn.execute_query_dict(
+        "SELECT count(*) AS present FROM information_schema.tables "
+        "WHERE table_schema = current_schema() AND table_name = ANY($1)",
+        [tables],
+    )
+    return rows[0]["present"] == len(tables)
+
+
 class DB:
     """Database class to handle Tortoise ORM initialization and connection management."""
 
-    async def init(self):
-        """Initialize the database connection and generate schemas."""
+    async def init(self) -> dict[str, float | None]:
+        """
+        Initialize the database connection, migrate if needed and warm the caches.
+
+        In `auto` migrations mode the migration engine only runs when the applied migration head differs from the local
+        one, or, without local migrations, when the schema is missing. `always` runs it on every boot.
+
+        Returns:
+            dict[str, float | None]: Seconds each phase took, None for a skipped phase, for the startup report.
+        """
         db_prog = Progress(
             SpinnerColumn(style="yellow", finished_text="[green]✓[/]"),
             "[progress.description]{task.description}",
         )
+        timings: dict[str, float | None] = {}
+
+        def lap(phase: str, start: float) -> float:
+            now = time.perf_counter()
+            timings[phase] = now - start
+            return now
 
         with db_prog as prog:
             db_task = prog.add_task("Initializing Database", total=1)
-            command = Command(tortoise_config=TORTOISE_ORM, app="models", location="./migrations")
-            await command.init()
-            await command.upgrade(run_in_transaction=True)
+            start = time.perf_counter()
             await Tortoise.init(config=TORTOISE_ORM)
-            await Tortoise.generate_schemas(safe=True)
+            start = lap("Connect", start)
+
+            if database.migrations == "always":
+                up_to_date = False
+            elif (local_head := _local_head()) is not None:
+                up_to_date = await _applied_head() == local_head
+            else:
+                up_to_date = await _schema_present()  # No local migrations, only a missing schema needs creating
+            start = lap("Migration Check", start)
+
+            if not up_to_date:
+                command = Command(tortoise_config=TORTOISE_ORM, app="models", location=MIGRATIONS_DIR)
+                await command.init()
+                await command.upgrade(run_in_transaction=True)
+                await Tortoise.init(config=TORTOISE_ORM)
+                await Tortoise.generate_schemas(safe=True)
+                start = lap("Migrate", start)
+            else:
+                timings["Migrate"] = None
+
+            await guild.warm_cache()
+            await logs.warm_cache()
+            await dev.warm_cache()
+            lap("Warm Caches", start)
             prog.update(db_task, description="[green]Initialized Database[/]", completed=1)
+        return timings
 
     async def close(self):
         """Close the database connection."""
@@ -1,10 +1,41 @@
 from ..schema import DevTable
 
+# Dev IDs are cached so permission checks & error reports never query the database.
+# The set is never mutated, writes swap in an updated copy (or a fresh load when nothing is cached yet) so readers
+# always see a complete snapshot & a load that raced with a write never stores its stale result.
+_dev_ids: frozenset[int] | None = None
+
+
+async def _load() -> frozenset[int]:
+    """Loads the dev IDs from the database."""
+    return frozenset(await DevTable.all().values_list("user_id", flat=True))
+
+
+async def warm_cache() -> None:
+    """Loads the dev IDs into the in-memory cache."""
+    global _dev_ids
+    _dev_ids = await _load()
+
 
 async def fetch_dev_ids() -> list[int]:
-    """Fetches all developer user IDs from the database."""
-    devs = await DevTable.all().values_list("user_id", flat=True)
-    return list(devs)
+    """Fetches all developer user IDs, loading them from the database only when the cache is empty."""
+    global _dev_ids
+    if _dev_ids is None:
+        devs = await _load()
+        if _dev_ids is None:
+            _dev_ids = devs
+    return sorted(_dev_ids)
+
+
+async def is_dev_id(user_id: int) -> bool:
+    """
+    Whether a user ID belongs to a developer.
+
+    Args:
+        user_id (int): The user ID to check.
+    """
+    dev_ids = _dev_ids if _dev_ids is not None else await fetch_dev_ids()
+    return user_id in dev_ids
 
 
 async def add_dev(user_id: int) -> None:
@@ -14,7 +45,9 @@ async def add_dev(user_id: int) -> None:
     Args:
         user_id (int): The user ID to perform action on.
     """
+    global _dev_ids
     await DevTable.get_or_create(user_id=user_id)
+    _dev_ids = await _load() if _dev_ids is None else _dev_ids | {user_id}
 
 
 async def remove_dev(user_id: int) -> None:
@@ -24,8 +57,10 @@ async def remove_dev(user_id: int) -> None:
     Args:
         user_id (int): The user ID to perform action on.
     """
+    global _dev_ids
     dev = await DevTable.filter(user_id=user_id).first()
     if dev:
         await dev.delete()
+        _dev_ids = await _load() if _dev_ids is None else _dev_ids - {user_id}
     else:
         raise ValueError(f"User ID {user_id} is not a developer.")
@@ -1,5 +1,25 @@
 from ..schema import GuildTable
 
+# Guild settings rows are cached per guild ID so hot listeners avoid a query per event.
+_cache: dict[int, GuildTable] = {}
+
+
+async def warm_cache() -> None:
+    """Loads every guild settings row into the in-memory cache with a single query."""
+    _cache.clear()
+    for guild in await GuildTable.all():
+        _cache[guild.guild_id] = guild
+
+
+def cached_guild_settings(guild_id: int) -> GuildTable | None:
+    """
+    Returns the cached settings for a guild without touching the database, or None if not cached.
+
+    Args:
+        guild_id (int): The guild ID to look up.
+    """
+    return _cache.get(guild_id)
+
 
 async def fetch_guild_ids() -> list[int]:
     """Fetches all guild IDs from the database."""
@@ -14,7 +34,9 @@ async def add_guild(guild_id: int) -> GuildTable:
     Args:
         guild_id (int): The guild ID to perform action on.
     """
-    return (await GuildTable.get_or_create(guild_id=guild_id))[0]
+    guild = (await GuildTable.get_or_create(guild_id=guild_id))[0]
+    _cache[guild_id] = guild
+    return guild
 
 
 async def remove_guild(guild_id: int) -> None:
@@ -24,6 +46,7 @@ async def remove_guild(guild_id: int) -> None:
     Args:
         guild_id (int): The guild ID to perform action on.
     """
+    _cache.pop(guild_id, None)
     guild = await GuildTable.filter(guild_id=guild_id).first()
     if guild:
         await guild.delete()
@@ -33,12 +56,17 @@ async def fetch_guild_settings(guild_id: int) -> GuildTable:
     """
     Fetches settings for a specific guild, creating the row if missing.
 
+    Served from the cache when possible; only unseen guilds hit the database.
+
     Args:
         guild_id (int): The guild ID to fetch settings for.
     """
+    if guild := _cache.get(guild_id):
+        return guild
     guild = await GuildTable.filter(guild_id=guild_id).first()
     if not guild:
-        guild = await add_guild(guild_id)
+        return await add_guild(guild_id)
+    _cache[guild_id] = guild
     return guild
 
 
@@ -52,7 +80,7 @@ async def set_ticket_cmds(guild_id: int, enabled: bool) -> None:
     """
     guild = await fetch_guild_settings(guild_id)
     guild.ticket_cmds = enabled
-    await guild.save()
+    await guild.save(update_fields=["ticket_cmds"])
 
 
 async def set_media_only(guild_id: int, channel_id: int | None) -> None:
@@ -65,7 +93,7 @@ async def set_media_only(guild_id: int, channel_id: int | None) -> None:
     """
     guild = await fetch_guild_settings(guild_id)
     guild.media_only_channel_id = channel_id
-    await guild.save()
+    await guild.save(update_fields=["media_only_channel_id"])
 
 
 async def set_autorole(guild_id: int, role_id: int | None) -> None:
@@ -78,4 +106,4 @@ async def set_autorole(guild_id: int, role_id: int | None) -> None:
     """
     guild = await fetch_guild_settings(guild_id)
     guild.autorole = role_id
-    await guild.save()
+    await guild.save(update_fields=["autorole"])
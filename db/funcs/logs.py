@@ -1,28 +1,50 @@
-from ..schema import GuildTable, LogChannelTable
+from ..schema import LogChannelTable
 from .guild import fetch_guild_settings
+from tortoise.transactions import in_transaction
+
+# Log routing is cached as `{guild_id: {log_type: channel_id}}` so log events never query the database.
+# The map is authoritative once warmed: every write below keeps it in sync.
+_routes: dict[int, dict[str, int]] = {}
+
+
+async def warm_cache() -> None:
+    """Loads the log routing map for every guild with a single query."""
+    _routes.clear()
+    rows = await LogChannelTable.all().values_list("guild__guild_id", "log_type", "channel_id")
+    for guild_id, log_type, channel_id in rows:
+        _routes.setdefault(guild_id, {})[log_type] = channel_id
+
+
+def forget_guild(guild_id: int) -> None:
+    """
+    Drops a guild's cached log routes. Used when the guild row is deleted and its log channels cascade with it.
+
+    Args:
+        guild_id (int): The guild ID to perform action on.
+    """
+    _routes.pop(guild_id, None)
 
 
 async def fetch_log_channel(guild_id: int, log_type: str) -> int | None:
     """
-    Fetches the log channel ID set for a log type, or None if not set.
+    Fetches the log channel ID set for a log type, or None if not set. Served from the routing cache.
 
     Args:
         guild_id (int): The guild ID to perform action on.
         log_type (str): The log type key (e.g. "moderation").
     """
-    row = await LogChannelTable.filter(guild__guild_id=guild_id, log_type=log_type).first()
-    return row.channel_id if row else None
+    routes = _routes.get(guild_id)
+    return routes.get(log_type) if routes else None
 
 
 async def fetch_log_channels(guild_id: int) -> dict[str, int]:
     """
-    Fetches all configured log channels for a guild as a `{log_type: channel_id}` mapping.
+    Fetches all configured log channels for a guild as a `{log_type: channel_id}` mapping. Served from the routing cache.
 
     Args:
         guild_id (int): The guild ID to perform action on.
     """
-    rows = await LogChannelTable.filter(guild__guild_id=guild_id)
-    return {row.log_type: row.channel_id for row in rows}
+    return dict(_routes.get(guild_id, {}))
 
 
 async def set_log_channel(guild_id: int, log_type: str, channel_id: int) -> None:
@@ -36,19 +58,55 @@ async def set_log_channel(guild_id: int, log_type: str, channel_id: int) -> None
     """
     guild = await fetch_guild_settings(guild_id)
     await LogChannelTable.update_or_create(guild=guild, log_type=log_type, defaults={"channel_id": channel_id})
+    _routes.setdefault(guild_id, {})[log_type] = channel_id
 
 
 async def set_all_log_channels(guild_id: int, log_types: list[str], channel_id: int) -> None:
     """
     Sets every given log type to the same channel.
 
+    Upserts all rows with one multi-row `INSERT ... ON CONFLICT` inside a single transaction.
+
     Args:
         guild_id (int): The guild ID to perform action on.
         log_types (list[str]): The log type keys to set.
         channel_id (int): The channel ID to log in.
     """
-    for log_type in log_types:
-        await set_log_channel(guild_id, log_type, channel_id)
+    if not log_types:
+        return
+    guild = await fetch_guild_settings(guild_id)
+    rows = [LogChannelTable(guild=guild, log_type=log_type, channel_id=channel_id) for log_type in log_types]
+    async with in_transaction() as conn:
+        await LogChannelTable.bulk_create(
+            rows, on_conflict=["guild_id", "log_type"], update_fields=["channel_id"], using_db=conn
+        )
+    _routes.setdefault(guild_id, {}).update(dict.fromkeys(log_types, channel_id))
+
+
+async def remove_log_channels(guild_id: int, log_types: list[str] | None = None) -> None:
+    """
+    Removes several log channel settings with a single delete inside a transaction, or all of them if no log types are given.
+
+    Args:
+        guild_id (int): The guild ID to perform action on.
+        log_types (list[str] | None): The log type keys to remove, or None for all.
+    """
+    routes = _routes.get(guild_id)
+    if routes is None:
+        return  # Nothing is configured, so there is nothing to delete
+    if log_types is None:
+        _routes.pop(guild_id, None)
+    else:
+        for log_type in log_types:
+            routes.pop(log_type, None)
+        if not routes:
+            _routes.pop(guild_id, None)
+    guild = await fetch_guild_settings(guild_id)
+    query = LogChannelTable.filter(guild_id=guild.id)  # Deletes can't join across relations
+    if log_types is not None:
+        query = query.filter(log_type__in=log_types)
+    async with in_transaction() as conn:
+        await query.using_db(conn).delete()
 
 
 async def remove_log_channel(guild_id: int, log_type: str | None = None) -> None:
@@ -59,10 +117,4 @@ async def remove_log_channel(guild_id: int, log_type: str | None = None) -> None
         guild_id (int): The guild ID to perform action on.
         log_type (str | None): The log type key to remove, or None for all.
     """
-    guild = await GuildTable.filter(guild_id=guild_id).first()
-    if not guild:
-        return
-    query = LogChannelTable.filter(guild=guild)  # Deletes can't join across relations
-    if log_type is not None:
-        query = query.filter(log_type=log_type)
-    await query.delete()
+    await remove_log_channels(guild_id, None if log_type is None else [log_type])
@@ -1,16 +1,23 @@
 import asyncio
 import discord
+import importlib
 import os
+import pkgutil
+import sys
+import time
 import toml
 from core import Client
 from db import DB
 from music import lyrics
+from music.player import close_scheduler
 from pyfiglet import Figlet
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 from rich.traceback import install
-from utils import config
+from utils import config, logger, temp
+from utils.emoji import reload_emoji
+from utils.profiler import profile_startup
 
 # Install rich traceback handler for all exceptions
 install(console=Console())
@@ -33,34 +40,113 @@ client = Client(
 )
 console = Console()
 
+
 # Startup printing
-with open("assets/ascii.txt") as f:
-    ascii_art = f.read().strip("\n")
-figlted_txt = Figlet().renderText(str(data["project"]["name"]).title())
-banner = Table.grid(padding=(0, 4))
-banner.add_column(vertical="middle")
-banner.add_column(vertical="middle")
-banner.add_row(
-    f"[cyan]{ascii_art}[/]", f"[cyan]{figlted_txt.rstrip()}[/] [yellow bold]v{data['project']['version']}[/]"
-)
-console.print(banner)
-console.print()
+def render_banner() -> Table:
+    """Renders the ascii art & figlet title banner."""
+    with open("assets/ascii.txt") as f:
+        ascii_art = f.read().strip("\n")
+    figlted_txt = Figlet().renderText(str(data["project"]["name"]).title())
+    banner = Table.grid(padding=(0, 4))
+    banner.add_column(vertical="middle")
+    banner.add_column(vertical="middle")
+    banner.add_row(
+        f"[cyan]{ascii_art}[/]", f"[cyan]{figlted_txt.rstrip()}[/] [yellow bold]v{data['project']['version']}[/]"
+    )
+    return banner
 
 
 # Loading all files
+cog_names = sorted(file[:-3] for file in os.listdir("./cogs") if file.endswith(".py"))
+# First-party packages imported by both the cogs & the rest of startup.
+shared_packages = ("core", "db", "music", "utils")
+
+
+def import_shared():
+    """
+    Imports every module of the :data:`shared_packages` on the main thread.
+
+    Done before :func:`import_cogs` starts, so the worker thread & the database init never race to import the same
+    modules for the first time and see them partially initialized.
+    """
+    for package in shared_packages:
+        for module in pkgutil.walk_packages(importlib.import_module(package).__path__, f"{package}."):
+            importlib.import_module(module.name)
+
+
+def import_cogs():
+    """
+    Imports every cog module ahead of registration.
+
+    Runs in a worker thread while the database initializes, so the heavy dependencies cogs pull in (psutil, babel, ...)
+    are already cached in `sys.modules` by the time :func:`load_cogs` registers them on the main thread. The shared
+    modules must already be imported by :func:`import_shared`.
+    """
+    for name in cog_names:
+        if not client.lazy.deferrable(name):
+            importlib.import_module(f"cogs.{name}")
+
+
 def load_cogs():
     cogs_prog = Progress(
         SpinnerColumn(style="yellow", finished_text="[green]✓[/]"),
         TextColumn("[progress.description]{task.description} [cyan]{task.completed}/{task.total}[/]"),
     )
     with cogs_prog as prog:
-        file_count = len([file for file in os.listdir("./cogs") if file.endswith(".py")])
-        task = cogs_prog.add_task("Loading Cogs", total=file_count)
-        for filename in os.listdir("./cogs"):
-            if filename.endswith(".py"):
-                prog.update(task, advance=1)
-                client.load_extension(f"cogs.{filename[:-3]}")
-        prog.update(task, description="[green]Loaded Cogs[/]", completed=file_count)
+        task = cogs_prog.add_task("Loading Cogs", total=len(cog_names))
+        for name in cog_names:
+            prog.update(task, advance=1)
+            if client.lazy.defer(name):
+                continue  # Imported on first use
+            client.load_extension(f"cogs.{name}")
+            client.lazy.record(name)
+        deferred = f" ({len(client.lazy.deferred)} deferred)" if client.lazy.pending else ""
+        prog.update(task, description=f"[green]Loaded Cogs{deferred}[/]", completed=len(cog_names))
+
+
+async def startup():
+    """
+    Runs the startup pipeline, overlapping the steps that don't depend on each other.
+
+    Shared modules are imported on the main thread first, then cog imports, the custom emoji load & the lyrics cache
+    load run in worker threads alongside the banner render & database init.
+    Cog registration waits on both the imports and the database. Each step is timed and reported once done.
+    """
+    timings: dict[str, float] = {}
+    began = time.perf_counter()
+
+    async def timed(step: str, aw):
+        start = time.perf_counter()
+        result = await aw
+        timings[step] = time.perf_counter() - start
+        return result
+
+    start = time.perf_counter()
+    import_shared()
+    timings["Import Shared Modules"] = time.perf_counter() - start
+    imports = asyncio.create_task(timed("Import Cogs", asyncio.to_thread(import_cogs)))
+    emojis = asyncio.create_task(timed("Load Emojis", asyncio.to_thread(reload_emoji)))
+    lyrics_cache = asyncio.create_task(timed("Load Lyrics Cache", asyncio.to_thread(lyrics.load_cache)))
+    console.print(await timed("Render Banner", asyncio.to_thread(render_banner)))
+    console.print()
+    db_phases = await timed("Initialize Database", DB().init())
+    await asyncio.gather(imports, emojis, lyrics_cache)
+    start = time.perf_counter()
+    load_cogs()
+    timings["Register Cogs"] = time.perf_counter() - start
+
+    steps = Table("Step", "Time", box=None, header_style="green", padding=(0, 2, 0, 2))
+    for step, took in timings.items():
+        steps.add_row(step, f"[cyan]{round(took * 1000)}ms[/]")
+        if step == "Initialize Database":
+            for i, (phase, phase_took) in enumerate(db_phases.items()):
+                prefix = "╰" if i == len(db_phases) - 1 else "├"
+                took_text = (
+                    "[dim]skipped (up to date)[/]" if phase_took is None else f"[cyan]{round(phase_took * 1000)}ms[/]"
+                )
+                steps.add_row(f"  [green]{prefix}[/] {phase}", took_text)
+    steps.add_row("[bold]Total[/]", f"[cyan bold]{round((time.perf_counter() - began) * 1000)}ms[/]")
+    console.print(steps)
 
 
 # Shutdown
@@ -72,22 +158,27 @@ async def shutdown():
     )
 
     with shutdown_prog as prog:
-        task = prog.add_task("Shutting down", total=3)
+        task = prog.add_task("Shutting down", total=6)
+        await logger.flush_all()
+        prog.advance(task, advance=1)
         await DB().close()
         prog.advance(task, advance=1)
+        await close_scheduler()
+        prog.advance(task, advance=1)
         await lyrics.close()
         prog.advance(task, advance=1)
+        await temp.flush()
+        prog.advance(task, advance=1)
         if not client.is_closed():
             await client.close()
         prog.advance(task, advance=1)
-        prog.update(task, description="[yellow]Bot has been shut down[/]", completed=3)
+        prog.update(task, description="[yellow]Bot has been shut down[/]", completed=6)
 
 
 # Main func to run the bot
 async def main():
     try:
-        await DB().init()
-        load_cogs()
+        await startup()
         async with client:
             await client.start(config.bot_token)
     finally:
@@ -95,9 +186,17 @@ async def main():
 
 
 # Execute the main func
-try:
-    asyncio.run(main())
-except KeyboardInterrupt:
-    console.print("\n[on red][black] STOP [/on red] [red]Keyboard interrupt received.[/]")
-except Exception:
-    console.print_exception()
+if "--profile-startup" in sys.argv:
+    # The re-run under `-X importtime` only needs to import what a boot would, the parent reports on it
+    if "importtime" in sys._xoptions:
+        import_shared()
+        import_cogs()
+    else:
+        profile_startup(sys.argv)
+else:
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        console.print("\n[on red][black] STOP [/on red] [red]Keyboard interrupt received.[/]")
+    except Exception:
+        console.print_exception()
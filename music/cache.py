@@ -0,0 +1,183 @@
+import asyncio
+import sonolink
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from sonolink.models import Playable, Playlist
+from sonolink.rest.schemas.track import Track
+
+AUTOCOMPLETE_TTL = 10 * 60
+AUTOCOMPLETE_MAX_ENTRIES = 1024
+# Seconds a user's keystroke waits before searching, so a newer keystroke can supersede it first
+AUTOCOMPLETE_DEBOUNCE = 0.3
+
+RESOLVE_TTL = 30 * 60
+RESOLVE_MAX_ENTRIES = 512
+
+# Formatted autocomplete choices by normalized query, in LRU order: query -> (expires at, choices)
+_choices: OrderedDict[str, tuple[float, list[str]]] = OrderedDict()
+# Searches on the wire, so concurrent keystrokes for the same query share one request
+_inflight: dict[str, asyncio.Task[list[str]]] = {}
+# Each user's latest debounced search, cancelled when they type again before it starts
+_pending: dict[int, asyncio.Task[list[str]]] = {}
+
+
+@dataclass(slots=True, frozen=True)
+class Resolved:
+    """
+    A resolved /play query, kept as raw track data so every enqueue builds its own fresh tracks from it.
+
+    Args:
+        tracks (tuple[:class:`Track`, ...]): The raw tracks, just the best match for plain searches.
+        playlist (:class:`Playlist` | None): The playlist the tracks came from, if the query was one.
+    """
+
+    tracks: tuple[Track, ...]
+    playlist: Playlist | None = None
+
+
+# Resolved tracks by (source, normalized query), shared across guilds, in LRU order: key -> (expires at, resolved)
+_resolved: OrderedDict[tuple[str, str], tuple[float, Resolved]] = OrderedDict()
+# Resolutions on the wire, so concurrent /play calls for the same query share one request
+_resolving: dict[tuple[str, str], asyncio.Task[Resolved | None]] = {}
+# Resolved track cache hits & misses since startup
+resolve_stats = {"hits": 0, "misses": 0}
+
+
+def normalize(query: str) -> str:
+    """
+    Normalizes a search query so equivalent queries share cache entries: case folded & whitespace collapsed.
+
+    Args:
+        query (str): The raw query.
+    """
+    return " ".join(query.casefold().split())
+
+
+def _cached(query: str) -> list[str] | None:
+    entry = _choices.get(query)
+    if entry is None:
+        return None
+    if entry[0] <= time.monotonic():
+        del _choices[query]
+        return None
+    _choices.move_to_end(query)
+    return entry[1]
+
+
+def _cached_prefix(query: str) -> list[str] | None:
+    """Returns the cached choices for the longest cached prefix of a query, or None if no prefix is cached."""
+    for end in range(len(query) - 1, 0, -1):
+        choices = _cached(query[:end].rstrip())
+        if choices:
+            return choices
+    return None
+
+
+async def _search(query: str, fetch: Callable[[str], Awaitable[list[str]]]) -> list[str]:
+    try:
+        choices = await fetch(query)
+    finally:
+        _inflight.pop(query, None)
+    _choices[query] = (time.monotonic() + AUTOCOMPLETE_TTL, choices)
+    _choices.move_to_end(query)
+    while len(_choices) > AUTOCOMPLETE_MAX_ENTRIES:
+        _choices.popitem(last=False)
+    return choices
+
+
+async def _debounced(query: str, fetch: Callable[[str], Awaitable[list[str]]]) -> list[str]:
+    await asyncio.sleep(AUTOCOMPLETE_DEBOUNCE)
+    task = _inflight.get(query)
+    if task is None:
+        task = _inflight[query] = asyncio.create_task(_search(query, fetch))
+    return await asyncio.shield(task)
+
+
+async def autocomplete(user_id: int, query: str, fetch: Callable[[str], Awaitable[list[str]]]) -> list[str]:
+    """
+    Returns autocomplete choices for a query, searching only when the cache can't answer.
+
+    Fresh searches are debounced per user: a keystroke waits briefly and is dropped if the same user types again.
+    While one runs, the cached choices for the longest prefix of the query are served straight away & the search
+    finishes in the background to fill the cache for the next keystroke.
+
+    Args:
+        user_id (int): The user typing, whose earlier pending search this one supersedes.
+        query (str): The normalized query.
+        fetch (Callable[[str], Awaitable[list[str]]]): Searches a query & formats its choices.
+    """
+    choices = _cached(query)
+    if choices is not None:
+        return choices
+    previous = _pending.get(user_id)
+    if previous and not previous.done():
+        previous.cancel()
+    task = _pending[user_id] = asyncio.create_task(_debounced(query, fetch))
+    task.add_done_callback(lambda t: _pending.pop(user_id, None) if _pending.get(user_id) is t else None)
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())  # Mark errors retrieved if nobody waits
+    if (choices := _cached_prefix(query)) is not None:
+        return choices
+    try:
+        return await asyncio.shield(task)
+    except asyncio.CancelledError:
+        if task.cancelled():
+            return []  # Superseded by the user's next keystroke
+        raise
+    except Exception:
+        return []
+
+
+async def _resolve(
+    client: sonolink.Client, key: tuple[str, str], query: str, source: sonolink.TrackSourceType
+) -> Resolved | None:
+    try:
+        result = await client.search_track(query, source=source)
+    finally:
+        _resolving.pop(key, None)
+    if result.is_error():
+        return None
+    data = result.result
+    if isinstance(data, Playlist):
+        resolved = Resolved(tuple(track.data for track in data.tracks), data)
+    elif isinstance(data, list):
+        resolved = Resolved((data[0].data,) if data else ())
+    elif isinstance(data, Playable):
+        resolved = Resolved((data.data,))
+    else:
+        resolved = Resolved(())
+    if resolved.tracks:  # Empty results aren't cached, the track may be uploaded or become available any time
+        _resolved[key] = (time.monotonic() + RESOLVE_TTL, resolved)
+        _resolved.move_to_end(key)
+        while len(_resolved) > RESOLVE_MAX_ENTRIES:
+            _resolved.popitem(last=False)
+    return resolved
+
+
+async def resolve(client: sonolink.Client, query: str, source: sonolink.TrackSourceType) -> Resolved | None:
+    """
+    Resolves a /play query or link into raw tracks, from the cache when the same query was resolved recently.
+
+    Args:
+        client (:class:`sonolink.Client`): The sonolink client to search with on a miss.
+        query (str): The query or link.
+        source (:class:`sonolink.TrackSourceType`): The source to search plain queries on.
+
+    Returns:
+        :class:`Resolved` | None: The resolved tracks (empty if nothing matched), or None if the search failed.
+    """
+    # Links are case sensitive (video IDs), only plain queries are normalized
+    key = (str(source), query.strip() if "://" in query else normalize(query))
+    entry = _resolved.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        _resolved.move_to_end(key)
+        resolve_stats["hits"] += 1
+        return entry[1]
+    if entry is not None:
+        del _resolved[key]
+    resolve_stats["misses"] += 1
+    task = _resolving.get(key)
+    if task is None:
+        task = _resolving[key] = asyncio.create_task(_resolve(client, key, query, source))
+    return await asyncio.shield(task)
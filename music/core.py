@@ -1,8 +1,67 @@
 import sonolink
 import time
+from array import array
+from collections.abc import Iterable
 from core import Client
-from sonolink.models import Filters, HistorySettings, InactivitySettings, Playable
-from utils import config
+from music import nodes
+from sonolink.models import Filters, HistorySettings, Playable, Playlist
+from sonolink.rest.schemas.track import Track
+
+
+class RequesterTable:
+    """
+    Queue entry -> requester map, so requesters live beside the queued tracks instead of in each track's extras.
+
+    Entries are keyed by object identity, so each queued copy of a song keeps its own requester. The entry itself is
+    held alongside its key, so its ID can't be reused by another track until it's pruned. Requesters are interned in an
+    array of user IDs, so a playlist queued by one user stores that ID once.
+    """
+
+    __slots__ = ("_entries", "_slots", "_users")
+
+    def __init__(self):
+        self._users = array("Q")  # Distinct requester IDs
+        self._slots: dict[int, int] = {}  # User ID -> its index in _users
+        self._entries: dict[int, tuple[Playable, int]] = {}  # id(entry) -> (entry, index of its requester in _users)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, track: Playable) -> bool:
+        return id(track) in self._entries
+
+    def tag(self, track: Playable, user_id: int) -> None:
+        """
+        Records the requester of a queue entry.
+
+        Args:
+            track (:class:`Playable`): The queue entry.
+            user_id (int): The requesting user's ID.
+        """
+        slot = self._slots.get(user_id)
+        if slot is None:
+            slot = self._slots[user_id] = len(self._users)
+            self._users.append(user_id)
+        self._entries[id(track)] = (track, slot)
+
+    def get(self, track: Playable) -> int | None:
+        """
+        Returns the requester's ID for a queue entry, or None if it wasn't tagged.
+
+        Args:
+            track (:class:`Playable`): The queue entry.
+        """
+        entry = self._entries.get(id(track))
+        return None if entry is None else self._users[entry[1]]
+
+    def prune(self, live: Iterable[Playable]) -> None:
+        """
+        Drops every entry not in `live`.
+
+        Args:
+            live (Iterable[:class:`Playable`]): Entries still playing, queued or in history.
+        """
+        self._entries = {id(track): self._entries[id(track)] for track in live if id(track) in self._entries}
 
 
 class SquarePlayer(sonolink.Player):
@@ -10,8 +69,13 @@ class SquarePlayer(sonolink.Player):
 
     def __init__(self, *args, **kwargs):
         kwargs.setdefault("history_settings", HistorySettings(enabled=True, max_items=50))
+        if kwargs.get("node") is None and len(args) == 2:
+            client, channel = args  # Connecting: place the player on the least loaded node instead of sonolink's pick
+            kwargs["node"] = nodes.best_node(client, channel.rtc_region)
         super().__init__(*args, **kwargs)
         self.presets: dict[str, Filters] = {}
+        self.preset_variants: dict[str, str] = {}  # Preset kind -> variant, kept so sessions can rebuild the presets
+        self.requesters = RequesterTable()
 
     @property
     def connected(self) -> bool:
@@ -29,6 +93,31 @@ class SquarePlayer(sonolink.Player):
         await super().resume()
         self._last_update = time.monotonic()
 
+    def tag_requester(
+        self, tracks: Track | Iterable[Track], user_id: int, playlist: Playlist | None = None
+    ) -> list[Playable]:
+        """
+        Builds fresh tracks to queue from raw (possibly cached & shared) track data, recording who requested them.
+
+        Every enqueue gets its own objects, so sonolink's per-track state & this player's requesters never leak into
+        another queue. Entries no longer playing, queued or in history are pruned first, once they outnumber the live
+        ones.
+
+        Args:
+            tracks (:class:`Track` | Iterable[:class:`Track`]): The raw track(s) requested.
+            user_id (int): The requesting user's ID.
+            playlist (:class:`Playlist` | None): The playlist the tracks came from, if any.
+        """
+        history = self.queue.history or ()
+        if len(self.requesters) > 2 * (len(self.queue.tracks) + len(history) + 1) + 256:
+            self.requesters.prune([*self.queue.tracks, *history, *([self.current] if self.current else [])])
+        entries = []
+        for data in (tracks,) if isinstance(tracks, Track) else tracks:
+            track = Playable(client=self.client.sonolink, data=data, playlist=playlist)
+            self.requesters.tag(track, user_id)
+            entries.append(track)
+        return entries
+
     async def apply_presets(self) -> None:
         """Applies the combination of all active equalizer presets, or clean audio when none remain."""
         combined = Filters()
@@ -46,45 +135,12 @@ def get_player(client: Client, guild_id: int) -> SquarePlayer | None:
 
 def requester_id(player: SquarePlayer, track: Playable) -> int | None:
     """Returns the requesting user's ID for a track; autoplay-discovered tracks belong to the bot."""
-    rid = getattr(track.extras, "requester", None)
+    rid = player.requesters.get(track)
     if rid is None and track.autoplay:
         return player.client.user.id
     return rid
 
 
-def tag_requester(client: Client, track: Playable, user_id: int) -> Playable:
-    """Returns a fresh copy of the track tagged with its requester."""
-    fresh = Playable(client=client.sonolink, data=track.data, playlist=track.playlist)
-    fresh.extras.requester = user_id
-    return fresh
-
-
-async def fetch_node_info(node: sonolink.Node) -> tuple[sonolink.models.ServerInfo | None, str]:
-    """Fetches a node's info and measures its REST round-trip latency; returns (None, "N/A") if unreachable."""
-    start = time.monotonic()
-    try:
-        info = await node.fetch_info()
-    except Exception:
-        return None, "N/A"
-    return info, f"{round((time.monotonic() - start) * 1000)}ms"
-
-
-def register_nodes(client: Client) -> None:
-    """Registers every configured lavalink node with the sonolink client. Safe to call repeatedly."""
-    for node in config.lavalink:
-        if client.sonolink.get_node(node["host"]) is not None:
-            continue
-        scheme = "https" if node["secure"] else "http"
-        client.sonolink.create_node(
-            uri=f"{scheme}://{node['host']}:{node['port']}",
-            password=node["password"],
-            id=node["host"],
-            auto_reconnect=True,
-            retries=None,
-            inactivity_settings=InactivitySettings(timeout=60, mode=sonolink.InactivityMode.ALL_BOTS),
-        )
-
-
 def fmt_time(ms: int | float) -> str:
     """Formats a duration in milliseconds as `H:MM:SS` or `M:SS`."""
     total_seconds = ms // 1000
@@ -1,14 +1,42 @@
 import aiohttp
+import asyncio
+import gzip
+import json
+import os
 import re
+import time
+from array import array
 from bisect import bisect_right
+from collections import OrderedDict
 from sonolink.models import Playable
 
 API_URL = "https://lrclib.net/api"
 HEADERS = {"User-Agent": "Square (Discord Bot)"}
 TIMEOUT = aiohttp.ClientTimeout(total=10)
 
+CACHE_PATH = "./.cache/lyrics.json.gz"
+CACHE_MAX_BYTES = 8 * 1024 * 1024
+# Bytes charged per cache entry on top of its key & text, so cached misses (empty text) still count against the budget
+CACHE_ENTRY_OVERHEAD = 64
+CACHE_TTL = 30 * 24 * 60 * 60
+NEGATIVE_TTL = 24 * 60 * 60  # Lyrics may be added to LRCLIB later, so misses are retried sooner
+CACHE_SAVE_DELAY = 60
+MAX_CONCURRENT_REQUESTS = 4
+REQUESTS_PER_SECOND = 4  # Per host
+
 _session: aiohttp.ClientSession | None = None
 
+# Process-wide lyrics cache: lookup key -> (expires at, raw LRC text, empty if the track has no synced lyrics).
+# Kept in LRU order & bounded by the total size of the entries, misses included.
+_cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
+_cache_bytes = 0
+_save_task: asyncio.Task | None = None
+
+# Lookups currently on the wire, so concurrent fetches of the same track share one request
+_inflight: dict[str, asyncio.Task[str]] = {}
+# Per-host time the next request may start at (loop clock)
+_next_slot: dict[str, float] = {}
+
 # LRC timestamp tag, e.g. [01:23.45]
 _lrc_rx = re.compile(r"\[(\d+):(\d{1,2}(?:\.\d+)?)\]")
 # Title/author noise that breaks lyrics lookups
@@ -18,24 +46,118 @@ _noise_rx = re.compile(
 )
 
 
+async def _throttle(session: aiohttp.ClientSession, ctx, params: aiohttp.TraceRequestStartParams) -> None:
+    """Spaces out request starts per host to at most :data:`REQUESTS_PER_SECOND`, by reserving the next free slot."""
+    loop = asyncio.get_running_loop()
+    now = loop.time()
+    slot = max(now, _next_slot.get(params.url.host, now))
+    _next_slot[params.url.host] = slot + 1 / REQUESTS_PER_SECOND
+    if slot > now:
+        await asyncio.sleep(slot - now)
+
+
 def _get_session() -> aiohttp.ClientSession:
     """
     Returns the shared LRCLIB session, creating it on first use.
 
     Reusing it keeps the connection alive, so only the first fetch pays for the handshake.
+    The session caps concurrent requests at :data:`MAX_CONCURRENT_REQUESTS` & rate limits each host.
     """
     global _session
     if _session is None or _session.closed:
-        _session = aiohttp.ClientSession(headers=HEADERS, timeout=TIMEOUT)
+        trace = aiohttp.TraceConfig()
+        trace.on_request_start.append(_throttle)
+        _session = aiohttp.ClientSession(
+            headers=HEADERS,
+            timeout=TIMEOUT,
+            connector=aiohttp.TCPConnector(limit=MAX_CONCURRENT_REQUESTS),
+            trace_configs=[trace],
+        )
     return _session
 
 
 async def close() -> None:
-    """Closes the shared LRCLIB session. Called on bot shutdown."""
+    """Closes the shared LRCLIB session & saves the lyrics cache. Called on bot shutdown."""
     global _session
     if _session is not None and not _session.closed:
         await _session.close()
     _session = None
+    if _save_task is not None and not _save_task.done():
+        _save_task.cancel()
+    await asyncio.to_thread(save_cache)
+
+
+def _size(key: str, text: str) -> int:
+    return CACHE_ENTRY_OVERHEAD + len(key.encode()) + len(text.encode())
+
+
+def _evict() -> None:
+    global _cache_bytes
+    while _cache_bytes > CACHE_MAX_BYTES and _cache:
+        key, (_, text) = _cache.popitem(last=False)
+        _cache_bytes -= _size(key, text)
+
+
+def _cache_get(key: str) -> str | None:
+    """Returns the cached LRC text for a lookup key (empty for a cached miss), or None if it isn't cached."""
+    global _cache_bytes
+    entry = _cache.get(key)
+    if entry is None:
+        return None
+    expires, text = entry
+    if expires <= time.time():
+        del _cache[key]
+        _cache_bytes -= _size(key, text)
+        return None
+    _cache.move_to_end(key)
+    return text
+
+
+def _cache_put(key: str, text: str) -> None:
+    global _cache_bytes, _save_task
+    if key in _cache:
+        _cache_bytes -= _size(key, _cache.pop(key)[1])
+    _cache[key] = (time.time() + (CACHE_TTL if text else NEGATIVE_TTL), text)
+    _cache_bytes += _size(key, text)
+    _evict()
+    if _save_task is None or _save_task.done():
+        _save_task = asyncio.create_task(_save_later())
+
+
+async def _save_later() -> None:
+    await asyncio.sleep(CACHE_SAVE_DELAY)
+    await asyncio.to_thread(save_cache, dict(_cache))
+
+
+def load_cache() -> None:
+    """Loads the persisted lyrics cache from disk, dropping expired entries. Called on startup."""
+    global _cache_bytes
+    try:
+        with gzip.open(CACHE_PATH, "rt", encoding="utf-8") as f:
+            entries = json.load(f)
+    except OSError, EOFError, json.JSONDecodeError:
+        return
+    now = time.time()
+    for key, expires, text in entries:
+        if expires > now:
+            _cache[key] = (expires, text)
+            _cache_bytes += _size(key, text)
+    _evict()
+
+
+def save_cache(entries: dict[str, tuple[float, str]] | None = None) -> None:
+    """
+    Writes the lyrics cache to disk as gzipped JSON, replacing the old file only once the new one is complete.
+
+    Args:
+        entries (dict[str, tuple[float, str]] | None): A snapshot of the cache to write, or None for the live cache.
+    """
+    entries = _cache if entries is None else entries
+    os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+    tmp_path = f"{CACHE_PATH}.tmp"
+    with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+        json.dump([[key, expires, text] for key, (expires, text) in entries.items()], f, separators=(",", ":"))
+    os.replace(tmp_path, CACHE_PATH)
 
 
 def _clean_query(track: Playable) -> tuple[str, str]:
@@ -50,9 +172,34 @@ def _clean_query(track: Playable) -> tuple[str, str]:
     return title, artist
 
 
-def parse_lrc(text: str) -> list[tuple[int, str]]:
+def _cache_key(title: str, artist: str, duration_sec: int) -> str:
+    return f"{title.casefold()}\x1f{artist.casefold()}\x1f{duration_sec}"
+
+
+class Lyrics:
     """
-    Parses LRC-formatted lyrics into a timestamp-sorted list of (position_ms, line) pairs.
+    Synced lyrics in a compact columnar form: an `array('i')` of timestamps alongside a tuple of the line texts.
+
+    Lookups bisect the timestamp column directly, so finding the active line allocates nothing.
+
+    Args:
+        timestamps (array): Line positions in milliseconds, sorted ascending.
+        lines (tuple[str, ...]): The line texts, in the same order as the timestamps.
+    """
+
+    __slots__ = ("lines", "timestamps")
+
+    def __init__(self, timestamps: array | None = None, lines: tuple[str, ...] = ()):
+        self.timestamps = timestamps if timestamps is not None else array("i")
+        self.lines = lines
+
+    def __len__(self) -> int:
+        return len(self.lines)
+
+
+def parse_lrc(text: str) -> Lyrics:
+    """
+    Parses LRC-formatted lyrics into a timestamp-sorted :class:`Lyrics` object.
 
     Handles multiple timestamp tags on a single line (repeated choruses).
 
@@ -60,9 +207,9 @@ def parse_lrc(text: str) -> list[tuple[int, str]]:
         text (str): The raw LRC lyrics text.
 
     Returns:
-        list[tuple[int, str]]: Timestamped lines sorted by position.
+        :class:`Lyrics`: Timestamped lines sorted by position.
     """
-    lines: list[tuple[int, str]] = []
+    pairs: list[tuple[int, str]] = []
     for raw in text.splitlines():
         tags = list(_lrc_rx.finditer(raw))
         if not tags:
@@ -70,65 +217,108 @@ def parse_lrc(text: str) -> list[tuple[int, str]]:
         content = raw[tags[-1].end() :].strip()
         for tag in tags:
             position = int(int(tag.group(1)) * 60_000 + float(tag.group(2)) * 1000)
-            lines.append((position, content))
-    lines.sort(key=lambda line: line[0])
-    return lines
+            pairs.append((position, content))
+    pairs.sort(key=lambda line: line[0])
+    return Lyrics(array("i", [ts for ts, _ in pairs]), tuple(line for _, line in pairs))
 
 
-async def fetch(track: Playable) -> list[tuple[int, str]]:
+async def _lookup(title: str, artist: str, duration_sec: int) -> str:
     """
-    Fetches synced lyrics for a track from LRCLIB.
+    Looks up synced lyrics on LRCLIB.
 
     Tries an exact signature match (title + artist + duration) first, then falls back to a search, keeping only results whose duration is within 10 seconds of the track.
 
+    Returns:
+        str: The raw LRC text, or an empty string if LRCLIB has no synced lyrics for the track.
+
+    Raises:
+        aiohttp.ClientError | TimeoutError: If LRCLIB couldn't be reached, so the miss isn't cached.
+    """
+    session = _get_session()
+    async with session.get(
+        f"{API_URL}/get",
+        params={"track_name": title, "artist_name": artist, "duration": str(duration_sec)},
+    ) as resp:
+        if resp.status == 200:
+            data = await resp.json()
+            if data.get("syncedLyrics"):
+                return data["syncedLyrics"]
+        elif resp.status >= 500 or resp.status == 429:
+            resp.raise_for_status()
+    async with session.get(
+        f"{API_URL}/search",
+        params={"track_name": title, "artist_name": artist},
+    ) as resp:
+        resp.raise_for_status()
+        results = await resp.json()
+    for result in results:
+        if result.get("syncedLyrics") and abs(result.get("duration", 0) - duration_sec) <= 10:
+            return result["syncedLyrics"]
+    return ""
+
+
+async def _resolve(key: str, title: str, artist: str, duration_sec: int) -> str:
+    try:
+        text = await _lookup(title, artist, duration_sec)
+    finally:
+        _inflight.pop(key, None)
+    _cache_put(key, text)
+    return text
+
+
+async def fetch(track: Playable, *, strict: bool = False) -> Lyrics:
+    """
+    Fetches synced lyrics for a track, from the process-wide cache when possible or else from LRCLIB.
+
+    Found lyrics & confirmed misses are cached by cleaned title, artist & duration, so repeat plays of a track in any
+    guild (or after a restart) need no network. Failed requests aren't cached.
+    Concurrent fetches of the same uncached track wait on a single shared request.
+
     Args:
         track (:class:`Playable`): The track to fetch lyrics for.
+        strict (bool): Raise when LRCLIB couldn't be reached instead of returning empty lyrics, so a failed lookup can
+            be told apart from a confirmed miss.
 
     Returns:
-        list[tuple[int, str]]: Timestamped lyric lines, or an empty list if none were found.
+        :class:`Lyrics`: Timestamped lyric lines, empty if none were found.
+
+    Raises:
+        aiohttp.ClientError | TimeoutError: If the lookup failed & `strict` is set.
     """
     if track.is_stream:
-        return []
+        return Lyrics()
     title, artist = _clean_query(track)
     duration_sec = round(track.length / 1000)
-    session = _get_session()
-    try:
-        async with session.get(
-            f"{API_URL}/get",
-            params={"track_name": title, "artist_name": artist, "duration": str(duration_sec)},
-        ) as resp:
-            if resp.status == 200:
-                data = await resp.json()
-                if data.get("syncedLyrics"):
-                    return parse_lrc(data["syncedLyrics"])
-        async with session.get(
-            f"{API_URL}/search",
-            params={"track_name": title, "artist_name": artist},
-        ) as resp:
-            if resp.status != 200:
-                return []
-            results = await resp.json()
-        for result in results:
-            if result.get("syncedLyrics") and abs(result.get("duration", 0) - duration_sec) <= 10:
-                return parse_lrc(result["syncedLyrics"])
-    except Exception:
-        return []
-    return []
-
-
-def window(lines: list[tuple[int, str]], position_ms: int) -> tuple[int, str, str, str]:
+    key = _cache_key(title, artist, duration_sec)
+    text = _cache_get(key)
+    if text is None:
+        task = _inflight.get(key)
+        if task is None:
+            task = _inflight[key] = asyncio.create_task(_resolve(key, title, artist, duration_sec))
+        try:
+            # Shielded so one guild cancelling its fetch doesn't cancel it for the others waiting on it
+            text = await asyncio.shield(task)
+        except Exception:
+            if strict:
+                raise
+            return Lyrics()
+    return parse_lrc(text) if text else Lyrics()
+
+
+def window(lyrics: Lyrics, position_ms: int) -> tuple[int, str, str, str]:
     """
     Returns the lyrics window around the playback position.
 
     Args:
-        lines (list[tuple[int, str]]): Timestamped lyric lines sorted by position.
+        lyrics (:class:`Lyrics`): Timestamped lyric lines sorted by position.
         position_ms (int): The current playback position in milliseconds.
 
     Returns:
         tuple[int, str, str, str]: (index, previous, current, next) where index is -1 before the first line and absent lines are empty strings.
     """
-    idx = bisect_right([ts for ts, _ in lines], position_ms) - 1
-    prev = lines[idx - 1][1] if idx > 0 else ""
-    current = lines[idx][1] if idx >= 0 else ""
-    upcoming = lines[idx + 1][1] if idx + 1 < len(lines) else ""
+    lines = lyrics.lines
+    idx = bisect_right(lyrics.timestamps, position_ms) - 1
+    prev = lines[idx - 1] if idx > 0 else ""
+    current = lines[idx] if idx >= 0 else ""
+    upcoming = lines[idx + 1] if idx + 1 < len(lines) else ""
     return idx, prev, current, upcoming
@@ -0,0 +1,186 @@
+import asyncio
+import discord
+import math
+import sonolink
+import time
+from core import Client
+from sonolink.models import InactivitySettings
+from utils import config
+
+# Seconds between node latency probes & rebalancing passes
+PROBE_INTERVAL = 30.0
+# Weight of the newest latency sample in each node's smoothed REST latency
+LATENCY_SMOOTHING = 0.3
+# Score added per ms of REST latency, 100ms weighs as much as 10 playing players
+LATENCY_WEIGHT = 0.1
+# A node is degraded past any of these: share of frames lost per player, system CPU load or REST latency (ms)
+DEGRADED_FRAME_LOSS = 0.05
+DEGRADED_CPU = 0.9
+DEGRADED_LATENCY = 1000.0
+# Consecutive degraded probes before players are moved off a node, so one slow sample doesn't trigger migrations
+DEGRADED_STRIKES = 2
+# Players moved off each degraded node per pass, so a struggling node isn't replaced by a stampede onto another
+MIGRATE_BATCH = 5
+
+# Node ID -> smoothed REST round-trip latency in ms, None while its probes fail
+_latency: dict[str, float | None] = {}
+# Node ID -> consecutive probes it has been found degraded in
+_strikes: dict[str, int] = {}
+
+
+async def fetch_node_info(node: sonolink.Node) -> tuple[sonolink.models.ServerInfo | None, str]:
+    """Fetches a node's info and measures its REST round-trip latency; returns (None, "N/A") if unreachable."""
+    start = time.monotonic()
+    try:
+        info = await node.fetch_info()
+    except Exception:
+        _latency[node.id] = None
+        return None, "N/A"
+    elapsed = (time.monotonic() - start) * 1000
+    previous = _latency.get(node.id)
+    _latency[node.id] = elapsed if previous is None else previous + LATENCY_SMOOTHING * (elapsed - previous)
+    return info, f"{round(elapsed)}ms"
+
+
+def register_nodes(client: Client) -> None:
+    """Registers every configured lavalink node with the sonolink client. Safe to call repeatedly."""
+    for node in config.lavalink:
+        if client.sonolink.get_node(node["host"]) is not None:
+            continue
+        scheme = "https" if node["secure"] else "http"
+        client.sonolink.create_node(
+            uri=f"{scheme}://{node['host']}:{node['port']}",
+            password=node["password"],
+            id=node["host"],
+            auto_reconnect=True,
+            retries=None,
+            inactivity_settings=InactivitySettings(timeout=60, mode=sonolink.InactivityMode.ALL_BOTS),
+            regions=node.get("regions"),
+        )
+
+
+def _node_of(voice: discord.VoiceProtocol) -> sonolink.Node | None:
+    if not isinstance(voice, sonolink.Player):
+        return None
+    try:
+        return voice.node
+    except RuntimeError:
+        return None  # Not attached to a node yet
+
+
+def _players_on(client: Client, node: sonolink.Node) -> list[sonolink.Player]:
+    return [voice for voice in client.voice_clients if _node_of(voice) is node]
+
+
+def score(client: Client, node: sonolink.Node) -> float:
+    """
+    Scores a node's load, lower is better: sonolink's penalty (players, CPU & lost frames) plus REST latency.
+
+    Lavalink only reports stats once a minute, so the player count is the larger of the reported one & the players
+    this bot has placed on the node since.
+
+    Args:
+        client (:class:`Client`): The bot client.
+        node (:class:`sonolink.Node`): The node to score.
+    """
+    stats = node.stats
+    if not node.is_connected or stats is None:
+        return math.inf
+    latency = _latency.get(node.id, 0.0)
+    if latency is None:
+        latency = DEGRADED_LATENCY
+    players = max(stats.playing_players, len(_players_on(client, node)))
+    return stats.penalty - stats.playing_players + players + latency * LATENCY_WEIGHT
+
+
+def degraded(node: sonolink.Node) -> bool:
+    """
+    Whether a node is struggling: failing latency probes, slow to answer, CPU bound or dropping audio frames.
+
+    Args:
+        node (:class:`sonolink.Node`): The node to check.
+    """
+    stats = node.stats
+    if stats is None:
+        return False
+    latency = _latency.get(node.id, 0.0)
+    if latency is None or latency >= DEGRADED_LATENCY or stats.cpu.system_load >= DEGRADED_CPU:
+        return True
+    frames = stats.frame_stats
+    if frames is None or not stats.playing_players:
+        return False
+    # Lavalink sends 3000 frames per playing player per minute
+    return (frames.nulled + max(frames.deficit, 0)) / (3000 * stats.playing_players) >= DEGRADED_FRAME_LOSS
+
+
+def best_node(
+    client: Client, region: str | discord.VoiceRegion | None = None, exclude: sonolink.Node | None = None
+) -> sonolink.Node | None:
+    """
+    Picks the connected node a new player should go on: the lowest scored healthy node in the voice region.
+
+    Builds on sonolink's :meth:`~sonolink.Client.get_best_node`, which it defers to until nodes report stats, adding
+    live player counts (sonolink's stats lag up to a minute behind placements) & REST latency to its penalty.
+    Falls back to nodes outside the region when none serve it, and to degraded nodes when every node is degraded.
+
+    Args:
+        client (:class:`Client`): The bot client.
+        region (str | :class:`discord.VoiceRegion` | None): The voice channel's RTC region, None for automatic.
+        exclude (:class:`sonolink.Node` | None): A node to leave out, e.g. the one being migrated off.
+
+    Returns:
+        :class:`sonolink.Node` | None: The best node, or None if no node is connected.
+    """
+    candidates = [node for node in client.sonolink.nodes if node.is_connected and node is not exclude]
+    if not candidates:
+        return None
+    if region is not None:
+        region = getattr(region, "value", region).removeprefix("vip-")
+        candidates = [node for node in candidates if region in node.regions] or candidates
+    candidates = [node for node in candidates if _strikes.get(node.id, 0) < DEGRADED_STRIKES] or candidates
+    if exclude is None and all(node.stats is None for node in candidates):
+        return client.sonolink.get_best_node(region=region)  # No stats to score on yet, use sonolink's own pick
+    return min(candidates, key=lambda node: score(client, node))
+
+
+async def probe(client: Client) -> None:
+    """
+    Measures every connected node's REST latency & updates how long each has been degraded for.
+
+    Args:
+        client (:class:`Client`): The bot client.
+    """
+    connected = [node for node in client.sonolink.nodes if node.is_connected]
+    await asyncio.gather(*(fetch_node_info(node) for node in connected))
+    for node in client.sonolink.nodes:
+        _strikes[node.id] = _strikes.get(node.id, 0) + 1 if node.is_connected and degraded(node) else 0
+
+
+async def rebalance(client: Client) -> dict[str, int]:
+    """
+    Moves players off nodes degraded for :data:`DEGRADED_STRIKES` probes in a row, onto the best node for each.
+
+    At most :data:`MIGRATE_BATCH` players leave a node per pass, & only while the target scores better than it.
+
+    Args:
+        client (:class:`Client`): The bot client.
+
+    Returns:
+        dict[str, int]: The number of players moved, by the ID of the node they left.
+    """
+    moved: dict[str, int] = {}
+    for node in client.sonolink.nodes:
+        if _strikes.get(node.id, 0) < DEGRADED_STRIKES:
+            continue
+        for player in _players_on(client, node)[:MIGRATE_BATCH]:
+            if player.channel is None:
+                continue  # Disconnecting
+            target = best_node(client, player.channel.rtc_region, exclude=node)
+            if target is None or degraded(target) or score(client, target) >= score(client, node):
+                break
+            try:
+                await player.move_to(target)
+            except Exception:
+                continue
+            moved[node.id] = moved.get(node.id, 0) + 1
+    return moved
@@ -4,167 +4,346 @@ import sonolink
 import time
 from core import Client
 from core.view import DesignerView
+from dataclasses import dataclass, field
 from discord import ui
-from music import lyrics, store
+from music import lyrics, sessions, store
 from music.core import SquarePlayer, fmt_time, get_player, requester_id
+from music.scheduler import RenderScheduler, TokenBucket
 from music.utils import get_source, music_interaction_check, music_log, reply, to_log_text
+from sonolink.models import Playable
 from utils import config
 from utils.emoji import emoji
 
-# Per-guild asyncio locks - prevents concurrent render_player executions for the same guild.
-_render_locks: dict[int, asyncio.Lock] = {}
-
-# Minimum seconds between lyrics-driven message edits - ~3.3 edits/5s worst case, which stays under Discord's ~5 edits/5s per-channel bucket with headroom for other renders.
-_LYRICS_MIN_EDIT_INTERVAL = 1.5
+# Player card edits per channel: a burst of 2, then one per 1.5s - ~5 edits/5s worst case, matching Discord's per-channel bucket.
+_EDIT_BURST = 2
+_EDIT_INTERVAL = 1.5
 # Upper bound on lyrics loop sleep so seeks/pauses are picked up promptly.
 _LYRICS_MAX_SLEEP = 5.0
 # Lookahead applied to the playback position so the edit lands as the line is sung, compensating for the HTTP round trip of the message edit.
 _LYRICS_LEAD_MS = 450
 # Seconds between progress-bar-only refreshes (no lyrics, or long instrumental gaps).
 _BAR_REFRESH_INTERVAL = 10.0
+# Upcoming tracks to resolve lyrics for ahead of the track boundary: the queue head & the first autoplay candidates.
+_PREFETCH_QUEUE_DEPTH = 2
+_PREFETCH_AUTOPLAY_DEPTH = 1
+# Seconds before the current track ends at which the prefetch re-runs, picking up tracks queued since it started.
+_PREFETCH_LEAD = 30.0
+# Concurrent prefetch lookups allowed per lavalink node, so busy nodes can't flood LRCLIB with speculative requests.
+_PREFETCH_NODE_BUDGET = 2
 
+# Lyrics-driven renders that may run at once across all guilds.
+_RENDER_WORKERS = 16
 
-def _get_render_lock(guild_id: int) -> asyncio.Lock:
-    """
-    Returns the render lock for a guild, creating it on first access.
+# Per-node prefetch budgets, keyed by node ID.
+_prefetch_budgets: dict[str, asyncio.Semaphore] = {}
+# Per-channel edit budgets every player card send & edit waits on, keyed by channel ID.
+_edit_buckets: dict[int, TokenBucket] = {}
 
-    Args:
-        guild_id (int): The guild ID to retrieve the lock for.
 
-    Returns:
-        :class:`asyncio.Lock`: The lock associated with the guild.
-    """
-    if guild_id not in _render_locks:
-        _render_locks[guild_id] = asyncio.Lock()
-    return _render_locks[guild_id]
+@dataclass(slots=True)
+class _RenderRequest:
+    """A pending player card render, resolved once a render built after it has been sent."""
+
+    force_new: bool = False
+    done: asyncio.Future = field(default_factory=lambda: asyncio.get_running_loop().create_future())
 
+    def resolve(self) -> None:
+        if not self.done.done():
+            self.done.set_result(None)
 
-async def render_player(client: Client, guild_id: int, *, force_new: bool = False) -> None:
+
+# Per-guild render waiting to be sent. Renders requested before it goes out merge into it.
+_pending_renders: dict[int, _RenderRequest] = {}
+# Per-guild task sending that guild's pending renders, one at a time.
+_renderers: dict[int, asyncio.Task] = {}
+
+
+@dataclass(slots=True)
+class _LyricsState:
+    """Per-guild lyrics updater state for the track currently playing."""
+
+    client: Client
+    identifier: str
+    lines: lyrics.Lyrics
+    last_idx: int | None = None
+    last_edit: float = 0.0
+    refetched: bool = False
+
+
+_lyrics_states: dict[int, _LyricsState] = {}
+
+
+def _edit_bucket(channel_id: int) -> TokenBucket:
+    """Returns the edit budget for a player channel, creating it on first access."""
+    if channel_id not in _edit_buckets:
+        _edit_buckets[channel_id] = TokenBucket(1 / _EDIT_INTERVAL, _EDIT_BURST)
+    return _edit_buckets[channel_id]
+
+
+def render_player(client: Client, guild_id: int, *, force_new: bool = False) -> asyncio.Future:
     """
-    Renders the single persistent player message.
+    Requests a render of the single persistent player message & returns straight away.
 
     Edits the player in place while it is still the latest message, otherwise deletes the stale player and posts a fresh one at the bottom of the channel.
-    Skips silently if a render is already in progress for this guild.
+    Every send & edit waits on the channel's token bucket. Renders requested while one is waiting merge into it (a
+    `force_new` request wins), and the card is built only once the token is in hand, so only the newest state is sent.
+    An edit whose payload matches the last one sent is skipped & its token returned.
 
     Args:
         client (:class:`Client`): The Discord bot client.
         guild_id (int): The guild to render the player for.
         force_new (bool): Always send a new player message instead of editing.
+
+    Returns:
+        :class:`asyncio.Future`: Resolves once a render covering this request has been sent. Only callers that need the
+            card on screen before continuing should await it.
     """
-    lock = _get_render_lock(guild_id)
-    if lock.locked():
-        return
+    done = asyncio.get_running_loop().create_future()
     player = get_player(client, guild_id)
-    if not player or not player.connected or not player.current:
-        return
-    channel = store.play_ch(guild_id)
-    if not channel:
-        return
-    async with lock:
-        view = MusicView(client, guild_id)
-        play_msg, _ = store.play_msg(guild_id)
-        if play_msg and not force_new:
-            try:
-                await play_msg.edit(view=view)
-                store.play_msg(guild_id, play_msg, view, "set")
+    state = store.get(guild_id)
+    if not player or not player.connected or not player.current or not state or not state.play_ch:
+        done.set_result(None)
+        return done
+    request = _pending_renders.get(guild_id)
+    if request is None:
+        request = _pending_renders[guild_id] = _RenderRequest()
+    request.force_new |= force_new
+    renderer = _renderers.get(guild_id)
+    if renderer is None or renderer.done():
+        _renderers[guild_id] = asyncio.create_task(_renderer(client, guild_id))
+    return asyncio.shield(request.done)
+
+
+async def _renderer(client: Client, guild_id: int) -> None:
+    """Sends a guild's pending renders one at a time, each after taking a token from its channel's bucket."""
+    try:
+        while guild_id in _pending_renders:
+            state = store.get(guild_id)
+            channel = state.play_ch if state else None
+            if not channel:
                 return
-            except discord.NotFound:
+            bucket = _edit_bucket(channel.id)
+            await bucket.acquire()
+            request = _pending_renders.pop(guild_id, None)
+            if request is None:
+                bucket.refund()
+                return
+            try:
+                if not await _render(client, guild_id, state, request.force_new):
+                    bucket.refund()
+            except discord.HTTPException:
                 pass
-        # Send new and delete old concurrently - both API calls happen in parallel
-        coros: list = [channel.send(view=view)]
-        if play_msg:
-            coros.append(play_msg.delete())
-        results = await asyncio.gather(*coros, return_exceptions=True)
-        new_msg = results[0]
-        if isinstance(new_msg, discord.Forbidden):
-            store.play_msg(guild_id, mode="clear")
-            return
-        if isinstance(new_msg, BaseException):
-            return
-        store.play_msg(guild_id, new_msg, view, "set")
-        store.chat_weight(guild_id, mode="clear")
+            finally:
+                request.resolve()
+    finally:
+        if (request := _pending_renders.pop(guild_id, None)) is not None:
+            request.resolve()
+        if _renderers.get(guild_id) is asyncio.current_task():
+            del _renderers[guild_id]
+
+
+async def _render(client: Client, guild_id: int, state: store.GuildMusicState, force_new: bool) -> bool:
+    """Sends or edits the player card. Returns False if nothing was sent because the card hasn't changed."""
+    player = get_player(client, guild_id)
+    if not player or not player.connected or not player.current:
+        return False
+    play_msg, view = state.play_msg, state.play_msg_view
+    if view is None or view.player is not player:
+        view = MusicView(client, guild_id)
+    else:
+        view.build()
+    payload = view.to_components()
+    if play_msg and not force_new:
+        if payload == view.sent:
+            return False
+        try:
+            await play_msg.edit(view=view)
+            view.sent = payload
+            state.play_msg_view = view
+            return True
+        except discord.NotFound:
+            pass
+    # Send new and delete old concurrently - both API calls happen in parallel
+    coros: list = [state.play_ch.send(view=view)]
+    if play_msg:
+        coros.append(play_msg.delete())
+    results = await asyncio.gather(*coros, return_exceptions=True)
+    new_msg = results[0]
+    if isinstance(new_msg, discord.Forbidden):
+        state.set_play_msg(None, None)
+        return True
+    if isinstance(new_msg, BaseException):
+        return True
+    view.sent = payload
+    state.set_play_msg(new_msg, view)
+    state.chat_weight = 0
+    return True
 
 
 def start_lyrics(client: Client, guild_id: int) -> None:
     """
-    Starts (or restarts) the synced-lyrics updater task for a guild.
+    Starts (or restarts) synced-lyrics updates for a guild.
 
-    Cancels any previous updater so only one loop runs per guild.
+    Resolves the current track's lyrics in a one-off task, then hands the guild to the shared render scheduler.
+    Cancels any previous lookup & scheduled tick so only one updater runs per guild.
 
     Args:
         client (:class:`Client`): The Discord bot client.
         guild_id (int): The guild to update lyrics for.
     """
-    task = store.lyrics_task(guild_id)
-    if task:
-        task.cancel()
-    store.lyrics_task(guild_id, asyncio.create_task(_lyrics_loop(client, guild_id)), "set")
+    state = store.get(guild_id)
+    if not state:
+        return
+    if state.lyrics_task:
+        state.lyrics_task.cancel()
+    _scheduler.cancel(guild_id)
+    _lyrics_states.pop(guild_id, None)
+    state.lyrics_task = asyncio.create_task(_load_lyrics(client, guild_id, state))
 
 
-async def _lyrics_loop(client: Client, guild_id: int) -> None:
+async def _load_lyrics(client: Client, guild_id: int, state: store.GuildMusicState) -> None:
+    """Fetches lyrics once per track (cached in the store, or taken from the prefetch) & schedules the first tick."""
+    player = get_player(client, guild_id)
+    if not player or not player.current or player.current.is_stream:
+        return
+    track = player.current
+    lines = state.lyrics_for(track.identifier)
+    if lines is None:
+        lines = state.prefetched.pop(track.identifier, None)
+        if lines is None:
+            lines = await lyrics.fetch(track)
+        state.lyrics_id, state.lyrics = track.identifier, lines
+    prefetch_lyrics(client, guild_id)
+    _lyrics_states[guild_id] = _LyricsState(client, track.identifier, lines)
+    _scheduler.schedule(guild_id)
+
+
+def _upcoming(player: SquarePlayer) -> list[Playable]:
+    """Returns the tracks likely to play next: the queue head (unless looping the current track) & autoplay candidates."""
+    if player.queue_mode is sonolink.QueueMode.LOOP:
+        return []
+    tracks = player.queue.tracks[:_PREFETCH_QUEUE_DEPTH]
+    if player.autoplay is not sonolink.AutoPlayMode.DISABLED:
+        tracks += player.queue.autoplay_tracks[:_PREFETCH_AUTOPLAY_DEPTH]
+    return [track for track in tracks if not track.is_stream]
+
+
+def prefetch_lyrics(client: Client, guild_id: int) -> None:
     """
-    Re-renders the player card whenever the active lyric line changes, keeping the progress bar fresh in between.
+    Starts resolving lyrics for the guild's upcoming tracks in the background, unless a prefetch is already running.
 
-    Fetches lyrics once per track (cached in the store), then sleeps until the next line boundary.
-    Edits are throttled to one per :data:`_LYRICS_MIN_EDIT_INTERVAL` seconds to stay clear of Discord rate limits, and nothing is edited while paused or when the line hasn't changed.
-    Tracks without lyrics (and instrumental gaps) still get a bar-only refresh every :data:`_BAR_REFRESH_INTERVAL` seconds.
+    Results are kept in the store so the next track's lyrics are ready at the track boundary.
 
     Args:
         client (:class:`Client`): The Discord bot client.
-        guild_id (int): The guild to update lyrics for.
+        guild_id (int): The guild to prefetch lyrics for.
     """
+    state = store.get(guild_id)
+    if not state or (state.prefetch_task and not state.prefetch_task.done()):
+        return
+    state.prefetch_task = asyncio.create_task(_prefetch(client, guild_id, state))
+
+
+async def _prefetch(client: Client, guild_id: int, state: store.GuildMusicState) -> None:
     player = get_player(client, guild_id)
-    if not player or not player.current or player.current.is_stream:
+    if not player or not player.connected:
         return
-    track = player.current
-    cached = store.lyrics(guild_id)
-    if cached and cached[0] == track.identifier:
-        lines = cached[1]
-    else:
-        lines = await lyrics.fetch(track)
-        store.lyrics(guild_id, track.identifier, lines, "set")
-    last_idx: int | None = None
-    last_edit = 0.0
-    while True:
-        current = player.current
-        if not player.connected or not current or current.identifier != track.identifier:
-            return
-        if not lines:
-            # No lyrics found: keep the progress bar moving with a slow tick.
-            if not player.paused:
-                await render_player(client, guild_id)
-            await asyncio.sleep(_BAR_REFRESH_INTERVAL)
+    upcoming = _upcoming(player)
+    keep = {track.identifier for track in upcoming}
+    for identifier in state.prefetched.keys() - keep:
+        del state.prefetched[identifier]
+    budget = _prefetch_budgets.setdefault(player.node.id, asyncio.Semaphore(_PREFETCH_NODE_BUDGET))
+    for track in upcoming:
+        if track.identifier in state.prefetched:
             continue
-        idx, *_ = lyrics.window(lines, player.position + _LYRICS_LEAD_MS)
-        if idx != last_idx:
-            wait = _LYRICS_MIN_EDIT_INTERVAL - (time.monotonic() - last_edit)
-            if wait > 0:
-                await asyncio.sleep(wait)
-                continue
-            await render_player(client, guild_id)
-            last_idx = idx
-            last_edit = time.monotonic()
-        elif not player.paused and time.monotonic() - last_edit >= _BAR_REFRESH_INTERVAL:
-            await render_player(client, guild_id)
-            last_edit = time.monotonic()
-        next_ts = lines[idx + 1][0] if idx + 1 < len(lines) else None
-        delay = (next_ts - _LYRICS_LEAD_MS - player.position) / 1000 if next_ts is not None else _LYRICS_MAX_SLEEP
-        await asyncio.sleep(min(max(delay, 0.25), _LYRICS_MAX_SLEEP))
+        try:
+            async with budget:
+                lines = await lyrics.fetch(track, strict=True)
+        except Exception:
+            continue  # Failed lookups aren't kept, the track fetches again when it starts
+        if not player.connected:
+            return
+        state.prefetched[track.identifier] = lines
+
+
+async def _lyrics_tick(guild_id: int) -> float | None:
+    """
+    Re-renders the player card when the active lyric line changes, keeping the progress bar fresh in between.
+
+    Run by the render scheduler, returning the delay until the next line boundary (or None once the track is over).
+    A line change waits for the channel's edit budget by being rescheduled rather than holding a worker, and nothing
+    is edited while paused or when the line hasn't changed.
+    Tracks without lyrics (and instrumental gaps) still get a bar-only refresh every :data:`_BAR_REFRESH_INTERVAL` seconds.
+    Lyrics for the upcoming tracks are prefetched again near the track's end.
+
+    Args:
+        guild_id (int): The guild to update lyrics for.
+    """
+    state = _lyrics_states.get(guild_id)
+    if state is None:
+        return None
+    client, lines = state.client, state.lines
+    player = get_player(client, guild_id)
+    current = player.current if player else None
+    if not player or not player.connected or not current or current.identifier != state.identifier:
+        _lyrics_states.pop(guild_id, None)
+        return None
+    if not state.refetched and current.length - player.position <= _PREFETCH_LEAD * 1000:
+        prefetch_lyrics(client, guild_id)
+        state.refetched = True
+    if not lines:
+        # No lyrics found: keep the progress bar moving with a slow tick.
+        if not player.paused:
+            render_player(client, guild_id)
+        return _BAR_REFRESH_INTERVAL
+    guild_state = store.get(guild_id)
+    channel = guild_state.play_ch if guild_state else None
+    idx, *_ = lyrics.window(lines, player.position + _LYRICS_LEAD_MS)
+    if idx != state.last_idx:
+        wait = _edit_bucket(channel.id).delay() if channel else 0.0
+        if wait > 0:
+            return wait
+        render_player(client, guild_id)
+        state.last_idx = idx
+        state.last_edit = time.monotonic()
+    elif not player.paused and time.monotonic() - state.last_edit >= _BAR_REFRESH_INTERVAL:
+        render_player(client, guild_id)
+        state.last_edit = time.monotonic()
+    next_ts = lines.timestamps[idx + 1] if idx + 1 < len(lines) else None
+    delay = (next_ts - _LYRICS_LEAD_MS - player.position) / 1000 if next_ts is not None else _LYRICS_MAX_SLEEP
+    return min(max(delay, 0.25), _LYRICS_MAX_SLEEP)
+
+
+_scheduler = RenderScheduler(_lyrics_tick, workers=_RENDER_WORKERS)
+
+
+def start_scheduler() -> None:
+    """Starts (or, after :func:`close_scheduler`, resumes) the shared lyrics render scheduler."""
+    _scheduler.start()
+
+
+async def close_scheduler() -> None:
+    """Stops the shared lyrics render scheduler's tasks, keeping its pending ticks for :func:`start_scheduler`."""
+    await _scheduler.close()
 
 
 def cleanup_guild(guild_id: int) -> None:
     """
-    Releases all per-guild in-memory state: locks, scheduled tasks (lyrics, relocation), and every store key.
+    Releases all per-guild in-memory state: pending renders, edit budgets, tasks, and the guild's music state.
 
-    Cancels tasks first, then flushes the store so the guild entry is dropped entirely.
+    Cancels the renderer, then releases the music state (cancelling its lyrics, prefetch & relocation tasks).
     A task is never cancelled from within itself, so the caller's own cleanup can finish.
     """
-    _render_locks.pop(guild_id, None)
-    for task_fn in (store.lyrics_task, store.render_task):
-        task = task_fn(guild_id)
-        if task and task is not asyncio.current_task():
-            task.cancel()
-    store.flush_store(guild_id)
+    _scheduler.cancel(guild_id)
+    _lyrics_states.pop(guild_id, None)
+    if (request := _pending_renders.pop(guild_id, None)) is not None:
+        request.resolve()
+    renderer = _renderers.pop(guild_id, None)
+    if renderer and renderer is not asyncio.current_task():
+        renderer.cancel()
+    state = store.release(guild_id)
+    if state and state.play_ch:
+        _edit_buckets.pop(state.play_ch.id, None)
 
 
 async def clear_player(guild_id: int) -> None:
@@ -174,10 +353,10 @@ async def clear_player(guild_id: int) -> None:
     Args:
         guild_id (int): The guild whose player message should be removed.
     """
-    play_msg, _ = store.play_msg(guild_id)
-    if play_msg:
+    state = store.get(guild_id)
+    if state and state.play_msg:
         try:
-            await play_msg.delete()
+            await state.play_msg.delete()
         except discord.HTTPException:
             pass
     cleanup_guild(guild_id)
@@ -197,6 +376,8 @@ async def stop_player(player: SquarePlayer, guild: discord.Guild) -> None:
     if getattr(player, "_square_stopped", False):
         return
     player._square_stopped = True
+    if not player.client.is_closed():
+        sessions.forget(guild.id)  # Stopped on purpose, not by a shutdown
     if guild.me.voice and guild.me.voice.channel:
         try:
             await guild.me.voice.channel.set_status(status=None)
@@ -237,7 +418,7 @@ async def slash_log(
     """
     await reply(ctx, content, color=color)
     if render:
-        await render_player(ctx.bot, ctx.guild.id)
+        render_player(ctx.bot, ctx.guild.id)
     await music_log(ctx.guild.id, f"{ctx.author.mention} {to_log_text(content)}", color=color)
 
 
@@ -247,29 +428,34 @@ class MusicContainer(ui.Container):
 
     Displays the track title (linked), artist, requester mention, and a position/duration progress bar (fully filled with a LIVE badge for streams).
     When synced lyrics are cached for the current track, a previous/current/next line window is appended with the current line in bold.
+    The track header is static for the whole track, so a cached one can be passed in & only the lyrics & bar are rebuilt.
 
     Args:
         player (:class:`SquarePlayer`): The active player with a current track set.
+        header (:class:`ui.Section` | None): A header previously built by :meth:`header` for the same track.
     """
 
-    def __init__(self, player: SquarePlayer):
+    def __init__(self, player: SquarePlayer, header: ui.Section | None = None):
         super().__init__()
+        self.items = [header or self.header(player)]
+        lyrics_text = self._lyrics_text(player)
+        if lyrics_text:
+            self.items.append(ui.TextDisplay(lyrics_text))
+        self.items.append(ui.TextDisplay(self._progress_bar(player)))
+
+    @staticmethod
+    def header(player: SquarePlayer) -> ui.Section:
+        """Builds the track header section: linked title, requester, artist & artwork."""
         rid = requester_id(player, player.current)
         info = (
             f"{emoji.user} **Requested By**: {f'<@{rid}>' if rid else 'Unknown'}\n"
             f"{emoji.mic} **Artist**: {get_source(player.current.source_name)['emoji']} {player.current.author}"
         )
-        self.items = [
-            ui.Section(
-                ui.TextDisplay(f"## [{player.current.title}]({player.current.uri})"),
-                ui.TextDisplay(info),
-                accessory=ui.Thumbnail(url=player.current.artwork),
-            )
-        ]
-        lyrics_text = self._lyrics_text(player)
-        if lyrics_text:
-            self.items.append(ui.TextDisplay(lyrics_text))
-        self.items.append(ui.TextDisplay(self._progress_bar(player)))
+        return ui.Section(
+            ui.TextDisplay(f"## [{player.current.title}]({player.current.uri})"),
+            ui.TextDisplay(info),
+            accessory=ui.Thumbnail(url=player.current.artwork),
+        )
 
     @staticmethod
     def _progress_bar(player: SquarePlayer, bar_length: int = 10) -> str:
@@ -290,10 +476,11 @@ class MusicContainer(ui.Container):
 
         Returns None when no lyrics are cached for the current track.
         """
-        cached = store.lyrics(player.guild.id)
-        if not cached or cached[0] != player.current.identifier or not cached[1]:
+        state = store.get(player.guild.id)
+        lines = state.lyrics_for(player.current.identifier) if state else None
+        if not lines:
             return None
-        _, prev, current, upcoming = lyrics.window(cached[1], player.position + _LYRICS_LEAD_MS)
+        _, prev, current, upcoming = lyrics.window(lines, player.position + _LYRICS_LEAD_MS)
 
         def fmt(line: str) -> str:
             return discord.utils.escape_markdown(line) if line else "♪"
@@ -307,6 +494,8 @@ class MusicView(DesignerView):
 
     Displays a :class:`MusicContainer` and two action rows: the first with pause/resume, stop, skip, loop cycle, and shuffle toggle; the second with an autoplay toggle.
     The view has no timeout and re-checks interaction eligibility on every button press.
+    One view lives for the whole player message: :meth:`build` reuses the header & control rows while the track &
+    player state they show are unchanged, and :attr:`sent` remembers the last payload so identical edits are skipped.
 
     Args:
         client (:class:`Client`): The bot client used to fetch the player and send follow-up logs.
@@ -321,12 +510,35 @@ class MusicView(DesignerView):
         self.interaction_check = lambda interaction: music_interaction_check(
             player=self.player, interaction=interaction, view=self
         )
+        self.sent: list[dict] | None = None  # Components payload last sent to Discord
+        self._static_key: tuple | None = None
+        self._header: ui.Section | None = None
+        self._controls: list[ui.ActionRow] = []
         self.build()
 
     def build(self):
+        """Rebuilds the card for the player's current state, reusing the static parts when they haven't changed."""
+        self.player = get_player(self.client, self.guild_id) or self.player
+        player = self.player
+        static_key = (
+            player.current.identifier,
+            requester_id(player, player.current),
+            player.paused,
+            player.queue_mode,
+            player.queue.shuffle_mode,
+            player.autoplay,
+        )
+        if static_key != self._static_key:
+            self._header = MusicContainer.header(player)
+            self._controls = self._build_controls()
+            self._static_key = static_key
         self.clear_items()
-        self.add_item(MusicContainer(self.player))
-        self.add_item(row := ui.ActionRow())
+        self.add_item(MusicContainer(player, self._header))
+        for row in self._controls:
+            self.add_item(row)
+
+    def _build_controls(self) -> list[ui.ActionRow]:
+        row = ui.ActionRow()
         for btn_emoji, action in [
             (emoji.play_white if self.player.paused else emoji.pause_white, "pause"),
             (emoji.stop_white, "stop"),
@@ -352,7 +564,7 @@ class MusicView(DesignerView):
         autoplay_on = self.player.autoplay is sonolink.AutoPlayMode.ENABLED
         autoplay_btn = ui.Button(emoji=emoji.autoplay if autoplay_on else emoji.autoplay_white, custom_id="autoplay")
         autoplay_btn.callback = self.autoplay_callback
-        self.add_item(ui.ActionRow(autoplay_btn))
+        return [row, ui.ActionRow(autoplay_btn)]
 
     async def pause_callback(self, interaction: discord.Interaction):
         if self.player.paused:
@@ -360,7 +572,7 @@ class MusicView(DesignerView):
         else:
             await self.player.pause()
         await interaction.response.defer()
-        await render_player(self.client, interaction.guild_id)
+        render_player(self.client, interaction.guild_id)
         await music_log(
             interaction.guild_id,
             f"{interaction.user.mention} {'paused' if self.player.paused else 'resumed'} the player.",
@@ -390,7 +602,7 @@ class MusicView(DesignerView):
             self.player.queue_mode = sonolink.QueueMode.NORMAL
             mode = "Disable"
         await interaction.response.defer()
-        await render_player(self.client, interaction.guild_id)
+        render_player(self.client, interaction.guild_id)
         await music_log(
             interaction.guild_id,
             f"{interaction.user.mention} {'enabled' if mode != 'Disable' else 'disabled'} {mode} loop.",
@@ -403,7 +615,7 @@ class MusicView(DesignerView):
         shuffled = self.player.queue.shuffle_mode is sonolink.ShuffleMode.PERSISTENT
         self.player.queue.shuffle_mode = sonolink.ShuffleMode.DEFAULT if shuffled else sonolink.ShuffleMode.PERSISTENT
         await interaction.response.defer()
-        await render_player(self.client, interaction.guild_id)
+        render_player(self.client, interaction.guild_id)
         await music_log(
             interaction.guild_id,
             f"{interaction.user.mention} {'disabled' if shuffled else 'enabled'} shuffle.",
@@ -413,7 +625,7 @@ class MusicView(DesignerView):
         enabled = self.player.autoplay is sonolink.AutoPlayMode.ENABLED
         self.player.autoplay = sonolink.AutoPlayMode.DISABLED if enabled else sonolink.AutoPlayMode.ENABLED
         await interaction.response.defer()
-        await render_player(self.client, interaction.guild_id)
+        render_player(self.client, interaction.guild_id)
         await music_log(
             interaction.guild_id,
             f"{interaction.user.mention} {'enabled' if not enabled else 'disabled'} autoplay.",
@@ -0,0 +1,187 @@
+import asyncio
+import heapq
+import itertools
+import time
+from collections.abc import Awaitable, Callable
+from rich.console import Console
+
+console = Console()
+
+
+class RenderScheduler:
+    """
+    Runs deadline-driven work for many keys (guilds) from one timer instead of a sleeping task per key.
+
+    Deadlines live in a heap with lazy deletion. One driver task sleeps until the earliest deadline, then hands due
+    keys to a bounded pool of workers. A key never runs on two workers at once, and whatever its handler returns is
+    its next deadline.
+
+    Args:
+        handler (Callable[[int], Awaitable[float | None]]): Runs one step for a key, returning the delay in seconds
+            until its next step, or None to stop scheduling it. A step that raises is logged & retried with backoff.
+        workers (int): How many handler calls may run at once.
+        backoff (float): Seconds before retrying a failed step, doubled per consecutive failure.
+        max_backoff (float): The longest retry delay.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[int], Awaitable[float | None]],
+        workers: int = 16,
+        backoff: float = 1.0,
+        max_backoff: float = 30.0,
+    ):
+        self.handler = handler
+        self.workers = workers
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._heap: list[tuple[float, int, int]] = []  # (deadline, tiebreaker, key)
+        self._due: dict[int, float] = {}  # Key -> its live deadline, heap entries not matching it are stale
+        self._running: set[int] = set()
+        self._rerun: set[int] = set()  # Keys that came due while running, run again once they finish
+        self._cancelled: set[int] = set()  # Keys cancelled while running, not rescheduled once they finish
+        self._failures: dict[int, int] = {}  # Key -> consecutive failed steps
+        self._counter = itertools.count()
+        self._ready: asyncio.Queue[int] = asyncio.Queue()
+        self._wakeup = asyncio.Event()
+        self._tasks: list[asyncio.Task] = []
+
+    def start(self) -> None:
+        """Starts the driver & workers if they aren't running. Scheduling a key starts them too."""
+        if self._tasks:
+            return
+        self._tasks.append(asyncio.create_task(self._drive()))
+        self._tasks += [asyncio.create_task(self._work()) for _ in range(self.workers)]
+        if self._heap:
+            self._wakeup.set()
+
+    def schedule(self, key: int, delay: float = 0.0) -> None:
+        """
+        Schedules a key to run after a delay. An earlier existing deadline for the key is kept.
+
+        Args:
+            key (int): The key to schedule.
+            delay (float): Seconds from now to run it.
+        """
+        self.start()
+        self._cancelled.discard(key)
+        self._push(key, time.monotonic() + delay)
+
+    def _push(self, key: int, deadline: float) -> None:
+        current = self._due.get(key)
+        if current is not None and current <= deadline:
+            return
+        self._due[key] = deadline
+        heapq.heappush(self._heap, (deadline, next(self._counter), key))
+        if self._heap[0][2] == key:
+            self._wakeup.set()
+        if len(self._heap) > 2 * len(self._due) + 64:
+            self._heap = [entry for entry in self._heap if self._due.get(entry[2]) == entry[0]]
+            heapq.heapify(self._heap)
+
+    def cancel(self, key: int) -> None:
+        """
+        Stops scheduling a key. A step already running finishes, but isn't rescheduled.
+
+        Args:
+            key (int): The key to cancel.
+        """
+        self._due.pop(key, None)
+        self._rerun.discard(key)
+        self._failures.pop(key, None)
+        if key in self._running:
+            self._cancelled.add(key)
+
+    async def _drive(self) -> None:
+        while True:
+            now = time.monotonic()
+            while self._heap and self._heap[0][0] <= now:
+                deadline, _, key = heapq.heappop(self._heap)
+                if self._due.get(key) != deadline:
+                    continue  # Superseded or cancelled
+                del self._due[key]
+                if key in self._running:
+                    self._rerun.add(key)
+                else:
+                    self._running.add(key)
+                    self._ready.put_nowait(key)
+            self._wakeup.clear()
+            timeout = self._heap[0][0] - now if self._heap else None
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except TimeoutError:
+                pass
+
+    async def _work(self) -> None:
+        while True:
+            key = await self._ready.get()
+            try:
+                delay = await self.handler(key)
+            except Exception:
+                console.print(f"[red bold]Scheduled step for {key} failed, retrying[/]")
+                console.print_exception()
+                failures = self._failures[key] = self._failures.get(key, 0) + 1
+                delay = min(self.backoff * 2 ** (failures - 1), self.max_backoff)
+            else:
+                self._failures.pop(key, None)
+            self._running.discard(key)
+            if key in self._cancelled:
+                self._cancelled.discard(key)
+            elif key in self._rerun:
+                self._rerun.discard(key)
+                self.schedule(key)
+            elif delay is not None:
+                self.schedule(key, delay)
+
+    async def close(self) -> None:
+        """
+        Stops the driver & workers.
+
+        Pending deadlines are kept & keys interrupted mid-step are due again, so :meth:`start` resumes where it left off.
+        """
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+        now = time.monotonic()
+        for key in self._running - self._cancelled:
+            self._push(key, now)
+        self._running.clear()
+        self._rerun.clear()
+        self._cancelled.clear()
+        self._ready = asyncio.Queue()
+
+
+class TokenBucket:
+    """
+    A token bucket rate limiter: bursts of up to `capacity` actions, refilled at `rate` tokens per second.
+
+    Args:
+        rate (float): Tokens added per second.
+        capacity (int): The most tokens the bucket holds.
+    """
+
+    __slots__ = ("capacity", "rate", "tokens", "updated")
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    def delay(self) -> float:
+        """Returns the seconds until a token is available, 0 if one is available now."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    async def acquire(self) -> None:
+        """Waits for a token & takes it."""
+        while (wait := self.delay()) > 0:
+            await asyncio.sleep(wait)
+        self.tokens -= 1
+
+    def refund(self) -> None:
+        """Returns a token taken for an action that didn't happen."""
+        self.tokens = min(self.capacity, self.tokens + 1)
@@ -0,0 +1,140 @@
+import asyncio
+import sonolink
+from core import Client
+from music import store
+from music.core import SquarePlayer, requester_id
+from music.filters import EqPresets
+from sonolink.models import Playable
+from utils import temp
+
+# Seconds between periodic snapshots of every live player
+SNAPSHOT_INTERVAL = 60.0
+# Sessions older than this aren't resumed, the listeners have likely moved on
+SESSION_TTL = 15 * 60
+
+# Whether this process has already restored its sessions, later node reconnects & cog reloads mustn't restore again
+_restored = False
+
+
+def _track(player: SquarePlayer, track: Playable) -> dict:
+    return {"encoded": track.encoded, "requester": requester_id(player, track)}
+
+
+def snapshot(player: SquarePlayer) -> dict | None:
+    """
+    Captures everything needed to resume a player: its channels, tracks, position & modes.
+
+    Args:
+        player (:class:`SquarePlayer`): The player to snapshot.
+
+    Returns:
+        dict | None: A JSON serializable snapshot, or None if the player has nothing to resume.
+    """
+    state = store.get(player.guild.id)
+    if not player.connected or not player.current or not state or not state.play_ch:
+        return None
+    return {
+        "voice_channel_id": player.channel.id,
+        "play_ch_id": state.play_ch.id,
+        "current": _track(player, player.current),
+        "position": player.position,
+        "paused": player.paused,
+        "queue": [_track(player, track) for track in player.queue.tracks],
+        "volume": player.volume,
+        "presets": dict(player.preset_variants),
+        "queue_mode": player.queue_mode.name,
+        "shuffle_mode": player.queue.shuffle_mode.name,
+        "autoplay": player.autoplay.name,
+    }
+
+
+def save(client: Client) -> None:
+    """
+    Snapshots every live player into the temp store, replacing the previous snapshots.
+
+    Args:
+        client (:class:`Client`): The bot client.
+    """
+    sessions = {}
+    for voice in client.voice_clients:
+        if isinstance(voice, SquarePlayer) and (data := snapshot(voice)):
+            sessions[str(voice.guild.id)] = data
+    temp.set("player_sessions", sessions, ttl=SESSION_TTL)
+
+
+def forget(guild_id: int) -> None:
+    """
+    Drops a guild's snapshot, so a player stopped on purpose isn't resumed after a restart.
+
+    Args:
+        guild_id (int): The guild whose session ended.
+    """
+    sessions = temp.get("player_sessions")
+    if sessions and sessions.pop(str(guild_id), None) is not None:
+        temp.set("player_sessions", sessions, ttl=SESSION_TTL)
+
+
+async def autosave(client: Client) -> None:
+    """Snapshots every live player every :data:`SNAPSHOT_INTERVAL` seconds, so a crash loses at most that much."""
+    while True:
+        await asyncio.sleep(SNAPSHOT_INTERVAL)
+        save(client)
+
+
+async def _resume(client: Client, guild_id: int, data: dict) -> bool:
+    guild = client.get_guild(guild_id)
+    if guild is None or guild.voice_client is not None:
+        return False
+    voice_channel = guild.get_channel(data["voice_channel_id"])
+    play_ch = guild.get_channel_or_thread(data["play_ch_id"])
+    if voice_channel is None or play_ch is None:
+        return False
+    player: SquarePlayer = await voice_channel.connect(cls=SquarePlayer)
+    try:
+        entries = [data["current"], *data["queue"]]
+        decoded = await player.node.decode_tracks(*(entry["encoded"] for entry in entries))
+        tracks = [
+            track if entry["requester"] is None else player.tag_requester(track.data, entry["requester"])[0]
+            for track, entry in zip(decoded, entries, strict=True)
+        ]
+        current, *queue = tracks
+        store.register(guild_id).play_ch = play_ch
+        player.queue.put(queue)
+        player.queue_mode = sonolink.QueueMode[data["queue_mode"]]
+        player.queue.shuffle_mode = sonolink.ShuffleMode[data["shuffle_mode"]]
+        player.autoplay = sonolink.AutoPlayMode[data["autoplay"]]
+        for kind, variant in data["presets"].items():
+            player.presets[kind] = EqPresets.build(kind, variant)
+            player.preset_variants[kind] = variant
+        await player.play(current, start=data["position"], volume=data["volume"], paused=data["paused"])
+        if player.presets:
+            await player.apply_presets()
+    except Exception:
+        await player.disconnect(force=True)
+        return False
+    return True
+
+
+async def restore(client: Client) -> int:
+    """
+    Resumes every snapshotted session by reconnecting to its voice channel & seeking back to where it left off.
+
+    Only the first call in a process restores anything. Snapshots are consumed, so a session that fails to resume
+    isn't retried on the next boot.
+
+    Args:
+        client (:class:`Client`): The bot client, ready & connected to a lavalink node.
+
+    Returns:
+        int: The number of sessions resumed.
+    """
+    global _restored
+    if _restored:
+        return 0
+    _restored = True
+    sessions = temp.get("player_sessions") or {}
+    temp.delete("player_sessions")
+    results = await asyncio.gather(
+        *(_resume(client, int(guild_id), data) for guild_id, data in sessions.items()), return_exceptions=True
+    )
+    return sum(result is True for result in results)
@@ -1,8 +1,8 @@
 import asyncio
 import discord
 from core.view import DesignerView
-from dataclasses import dataclass
-from typing import Any, Literal
+from dataclasses import dataclass, field
+from music.lyrics import Lyrics
 
 
 @dataclass
@@ -13,184 +13,99 @@ class Types:
     PlayerMessage = discord.Message
 
 
-store: dict[
-    int,
-    dict[str, Any],
-] = {}
-
-
-# Play channel
-def play_ch(
-    guild_id: int,
-    channel: Types.PlayerChannel | None = None,
-    mode: Literal["get", "set"] = "get",
-) -> Types.PlayerChannel | None:
+@dataclass(slots=True)
+class GuildMusicState:
     """
-    Gets or sets the play channel for a guild.
+    Per-guild music state, registered when a player connects and released when it's torn down.
 
     Args:
-        guild_id (int): The ID of the guild.
-        channel (:class:`Types.PlayerChannel` | None): The channel to set, or None to get the current value.
-        mode (str): The operation mode, either "get" or "set".
+        play_ch (:class:`Types.PlayerChannel` | None): The channel the player card & logs are posted in.
+        play_msg (:class:`Types.PlayerMessage` | None): The player card message.
+        play_msg_view (:class:`DesignerView` | None): The view attached to the player card.
+        render_task (:class:`asyncio.Task` | None): The scheduled player card relocation.
+        lyrics_id (str | None): The identifier of the track :attr:`lyrics` belong to.
+        lyrics (:class:`Lyrics` | None): Synced lyrics for the currently playing track.
+        lyrics_task (:class:`asyncio.Task` | None): The current track's lyrics lookup.
+        prefetched (dict[str, :class:`Lyrics`]): Lyrics resolved ahead of time for upcoming tracks, keyed by identifier.
+        prefetch_task (:class:`asyncio.Task` | None): The upcoming tracks' lyrics lookup.
+        chat_weight (int): Accumulated visual height (estimated chat lines) posted since the player card was last sent.
     """
-    match mode:
-        case "get":
-            guild = store.get(guild_id, {})
-            if guild:
-                return guild.get("play_ch", None)
-            return None
-        case "set":
-            if guild_id not in store:
-                store[guild_id] = {}
-            store[guild_id]["play_ch"] = channel
-
-
-# Play msg
-def play_msg(
-    guild_id: int,
-    msg: Types.PlayerMessage | None = None,
-    view: DesignerView | None = None,
-    mode: Literal["get", "set", "clear"] = "get",
-) -> tuple[Types.PlayerMessage, DesignerView] | None:
+
+    play_ch: Types.PlayerChannel | None = None
+    play_msg: Types.PlayerMessage | None = None
+    play_msg_view: DesignerView | None = None
+    render_task: asyncio.Task | None = None
+    lyrics_id: str | None = None
+    lyrics: Lyrics | None = None
+    lyrics_task: asyncio.Task | None = None
+    prefetched: dict[str, Lyrics] = field(default_factory=dict)
+    prefetch_task: asyncio.Task | None = None
+    chat_weight: int = 0
+
+    def lyrics_for(self, identifier: str) -> Lyrics | None:
+        """
+        Returns the cached lyrics if they belong to the given track, else None.
+
+        Args:
+            identifier (str): The track identifier.
+        """
+        return self.lyrics if self.lyrics_id == identifier else None
+
+    def set_play_msg(self, msg: Types.PlayerMessage | None, view: DesignerView | None) -> None:
+        """
+        Sets (or clears, with None) the player card message & its view.
+
+        Args:
+            msg (:class:`Types.PlayerMessage` | None): The player card message.
+            view (:class:`DesignerView` | None): The view attached to it.
+        """
+        self.play_msg = msg
+        self.play_msg_view = view
+
+
+# Guild ID -> its music state, only guilds with a live player are registered
+_states: dict[int, GuildMusicState] = {}
+
+
+def get(guild_id: int) -> GuildMusicState | None:
     """
-    Gets or sets the play message for a guild.
+    Returns a guild's music state, or None if it has none registered.
 
     Args:
         guild_id (int): The ID of the guild.
-        msg (:class:`Types.PlayerMessage` | None): The message to set, or None to get the current value.
-        view (:class:`DesignerView` | None): The view to set, or None to get the current value.
-        mode (str): The operation mode, either "get", "set", or "clear".
     """
-    match mode:
-        case "get":
-            guild = store.get(guild_id, {})
-            return (guild.get("play_msg", None), guild.get("play_msg_view", None))
-        case "set":
-            if guild_id not in store:
-                store[guild_id] = {}
-            store[guild_id]["play_msg"] = msg
-            store[guild_id]["play_msg_view"] = view
-        case "clear":
-            if guild_id in store and "play_msg" in store[guild_id]:
-                del store[guild_id]["play_msg"]
-                del store[guild_id]["play_msg_view"]
-
-
-def render_task(
-    guild_id: int, task: asyncio.Task | None = None, mode: Literal["get", "set", "clear"] = "get"
-) -> asyncio.Task | None:
-    match mode:
-        case "get":
-            return store.get(guild_id, {}).get("render_task", None)
-        case "set":
-            if guild_id not in store:
-                store[guild_id] = {}
-            store[guild_id]["render_task"] = task
-        case "clear":
-            if guild_id in store and "render_task" in store[guild_id]:
-                del store[guild_id]["render_task"]
-
-
-# Synced lyrics cache for the currently playing track
-def lyrics(
-    guild_id: int,
-    identifier: str | None = None,
-    lines: list[tuple[int, str]] | None = None,
-    mode: Literal["get", "set", "clear"] = "get",
-) -> tuple[str, list[tuple[int, str]]] | None:
+    return _states.get(guild_id)
+
+
+def register(guild_id: int) -> GuildMusicState:
     """
-    Gets, sets, or clears the cached lyrics for a guild.
+    Returns a guild's music state, registering a fresh one if it has none.
 
     Args:
         guild_id (int): The ID of the guild.
-        identifier (str | None): The track identifier the lyrics belong to.
-        lines (list[tuple[int, str]] | None): Timestamped lyric lines.
-        mode (str): The operation mode, either "get", "set", or "clear".
-
-    Returns:
-        tuple[str, list[tuple[int, str]]] | None: The cached (identifier, lines) pair, or None.
     """
-    match mode:
-        case "get":
-            return store.get(guild_id, {}).get("lyrics", None)
-        case "set":
-            if guild_id not in store:
-                store[guild_id] = {}
-            store[guild_id]["lyrics"] = (identifier, lines or [])
-        case "clear":
-            if guild_id in store:
-                store[guild_id].pop("lyrics", None)
-
-
-# Lyrics updater task
-def lyrics_task(
-    guild_id: int, task: asyncio.Task | None = None, mode: Literal["get", "set", "clear"] = "get"
-) -> asyncio.Task | None:
-    match mode:
-        case "get":
-            return store.get(guild_id, {}).get("lyrics_task", None)
-        case "set":
-            if guild_id not in store:
-                store[guild_id] = {}
-            store[guild_id]["lyrics_task"] = task
-        case "clear":
-            if guild_id in store and "lyrics_task" in store[guild_id]:
-                del store[guild_id]["lyrics_task"]
-
-
-# Accumulated visual height (estimated chat lines) posted since the player message was last sent
-def chat_weight(
-    guild_id: int,
-    value: int | None = None,
-    mode: Literal["get", "add", "clear"] = "get",
-) -> int:
+    state = _states.get(guild_id)
+    if state is None:
+        state = _states[guild_id] = GuildMusicState()
+    return state
+
+
+def release(guild_id: int) -> GuildMusicState | None:
     """
-    Gets, adds to, or clears the accumulated chat weight for a guild.
+    Unregisters a guild's music state so destroyed players leave no per-guild residue.
+
+    Cancels the state's tasks, except the one calling this, so the caller's own cleanup can finish.
 
     Args:
         guild_id (int): The ID of the guild.
-        value (int | None): The number of estimated lines to add (for "add" mode).
-        mode (str): The operation mode, either "get", "add", or "clear".
 
     Returns:
-        int: The accumulated weight after the operation (0 for "clear").
-    """
-    match mode:
-        case "get":
-            return store.get(guild_id, {}).get("chat_weight", 0)
-        case "add":
-            if guild_id not in store:
-                store[guild_id] = {}
-            store[guild_id]["chat_weight"] = store[guild_id].get("chat_weight", 0) + (value or 0)
-            return store[guild_id]["chat_weight"]
-        case "clear":
-            if guild_id in store:
-                store[guild_id].pop("chat_weight", None)
-            return 0
-
-
-_MUSIC_KEYS = {
-    "chat_weight",
-    "lyrics",
-    "lyrics_task",
-    "play_ch",
-    "play_msg",
-    "play_msg_view",
-    "render_task",
-}
-
-
-def flush_store(guild_id: int) -> None:
-    """
-    Removes all music-related keys for a guild from the store.
-
-    Drops the guild entry entirely once it is empty so destroyed players leave no per-guild residue.
-    Tasks are only removed here, not cancelled - cancel them first via :func:`player.cleanup_guild`.
+        :class:`GuildMusicState` | None: The released state, or None if none was registered.
     """
-    guild = store.get(guild_id)
-    if guild is None:
-        return
-    for key in _MUSIC_KEYS:
-        guild.pop(key, None)
-    if not guild:
-        store.pop(guild_id, None)
+    state = _states.pop(guild_id, None)
+    if state is None:
+        return None
+    for task in (state.lyrics_task, state.prefetch_task, state.render_task):
+        if task and task is not asyncio.current_task():
+            task.cancel()
+    return state
@@ -81,11 +81,11 @@ async def music_log(guild_id: int, content: str, *, color: int | None = None) ->
         content (str): The message text.
         color (int | None): Optional accent color for the container.
     """
-    channel = store.play_ch(guild_id)
-    if not channel:
+    state = store.get(guild_id)
+    if not state or not state.play_ch:
         return
     try:
-        await channel.send(view=container(content, color), delete_after=5)
+        await state.play_ch.send(view=container(content, color), delete_after=5)
     except discord.HTTPException:
         # Missing send permission in the player channel must not break the player action itself.
         pass
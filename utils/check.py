@@ -1,5 +1,5 @@
 import discord
-from db.funcs.dev import fetch_dev_ids
+from db.funcs.dev import is_dev_id
 from discord.ext import commands
 from utils import config
 
@@ -42,8 +42,7 @@ def is_dev(_ctx: discord.ApplicationContext | None = None):
 
     async def check_func(ctx: discord.ApplicationContext):
         owner_id = config.owner_id
-        dev_ids = await fetch_dev_ids()
-        if ctx.author.id == owner_id or ctx.author.id in dev_ids:
+        if ctx.author.id == owner_id or await is_dev_id(ctx.author.id):
             return True
         else:
             if _ctx is None:
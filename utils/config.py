@@ -1,7 +1,7 @@
 import os
 import toml
-from attr import dataclass
-from typing import TypedDict
+from attr import dataclass, fields
+from typing import NotRequired, TypedDict
 from urllib.parse import urlparse, urlunparse
 
 config_file_path = "./config.toml"
@@ -17,6 +17,7 @@ owner_guild_ids: list[int] = data["owner-guild-ids"]
 system_channel_id: int = data["system-channel-id"]
 support_server_url: str = data["support-server-url"]
 bot_token: str = data["bot-token"]
+lazy_cogs: list[str] = data.get("lazy-cogs", [])
 
 
 def _resolve_db_url(url: str) -> str:
@@ -40,6 +41,34 @@ def _resolve_db_url(url: str) -> str:
 db_url: str = _resolve_db_url(data["database-url"])
 
 
+# Database connection pool configuration
+@dataclass
+class DatabaseConfig:
+    pool_min_size: int = 2
+    pool_max_size: int = 10
+    command_timeout: float = 30
+    statement_cache_size: int = 100
+    migrations: str = "auto"
+
+
+def _database() -> DatabaseConfig:
+    """
+    Returns the database pool configuration, falling back to defaults for keys missing from `[database]`.
+
+    Raises:
+        ValueError: If `[database]` has keys that aren't database options.
+    """
+    options = {key.replace("-", "_"): value for key, value in data.get("database", {}).items()}
+    unknown = options.keys() - {field.name for field in fields(DatabaseConfig)}
+    if unknown:
+        names = ", ".join(f"`{key.replace('_', '-')}`" for key in sorted(unknown))
+        raise ValueError(f"Unknown option(s) in the [database] table of {config_file_path}: {names}")
+    return DatabaseConfig(**options)
+
+
+database = _database()
+
+
 # Colors
 @dataclass
 class ColorConfig:
@@ -66,6 +95,7 @@ class LavalinkConfig(TypedDict):
     port: int
     password: str
     secure: bool
+    regions: NotRequired[list[str]]
 
 
 def _lavalink_nodes() -> list[LavalinkConfig]:
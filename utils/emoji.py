@@ -188,7 +188,8 @@ def get_emoji_instance() -> Emoji:
     return Emoji.from_json(custom_emoji_file_path)
 
 
-emoji = get_emoji_instance()
+# Starts on the defaults; the custom set is loaded by `reload_emoji()` during startup, off the import path.
+emoji = Emoji()
 
 
 def update_emoji(name: str, value: str) -> None:
@@ -1,9 +1,19 @@
+import asyncio
 import discord
 import enum
 from core import Client
 from core.view import DesignerView
+from dataclasses import dataclass, field
+from db.funcs.logs import forget_guild
+from discord import ui
 from utils import webhook
 
+# Seconds log views are collected before their batch is flushed as one webhook message.
+_BATCH_WINDOW = 1.5
+# Discord's per-message limits for components (nested ones included) & total text display characters.
+_MAX_COMPONENTS = 40
+_MAX_TEXT = 4000
+
 
 class LogType(enum.Enum):
     """
@@ -38,8 +48,122 @@ class LogType(enum.Enum):
 
 
 async def cleanup_guild(guild_id: int, channel_ids: set[int]) -> None:
-    """Removes all cached webhooks belonging to the given guild's channels."""
+    """Removes all cached webhooks, log routes & queued log batches belonging to the given guild."""
+    forget_guild(guild_id)
     webhook.cleanup(channel_ids)
+    for key in [key for key in _batches if key[0] in channel_ids]:
+        _detach(key)
+
+
+@dataclass(slots=True)
+class _Batch:
+    """Log views queued for one (channel, thread, log type) destination, waiting to be packed & sent together."""
+
+    client: Client
+    target: discord.abc.Messageable
+    thread: discord.Thread | None
+    log_type: LogType
+    views: list[DesignerView] = field(default_factory=list)
+    weight: int = 0
+    task: asyncio.Task | None = None
+
+
+# Pending batches keyed by (channel ID, thread ID, log type); the webhook username differs per log type.
+_batches: dict[tuple[int, int | None, LogType], _Batch] = {}
+# Sends of batches already detached from `_batches`, awaited on shutdown so queued logs aren't lost.
+_sending: set[asyncio.Task] = set()
+
+
+def _walk(items) -> list[ui.Item]:
+    """Flattens view items, including those nested in containers, sections & action rows."""
+    flat = []
+    for item in items:
+        flat.append(item)
+        flat += _walk(getattr(item, "items", None) or getattr(item, "children", None) or [])
+        if accessory := getattr(item, "accessory", None):
+            flat.append(accessory)
+    return flat
+
+
+def _measure(view: DesignerView) -> tuple[int, int]:
+    """Returns a view's (component count, text display characters) as counted against Discord's limits."""
+    items = _walk(view.children)
+    return len(items), sum(len(item.content) for item in items if isinstance(item, ui.TextDisplay))
+
+
+def _pack(views: list[DesignerView]) -> list[DesignerView]:
+    """Merges log views into as few views as the per-message component & text limits allow, keeping their order."""
+    packed: list[DesignerView] = []
+    items: list[ui.Item] = []
+    count = text = 0
+    for view in views:
+        view_count, view_text = _measure(view)
+        if items and (count + view_count > _MAX_COMPONENTS or text + view_text > _MAX_TEXT):
+            packed.append(DesignerView(*items))
+            items, count, text = [], 0, 0
+        items += view.children
+        count += view_count
+        text += view_text
+    if items:
+        packed.append(DesignerView(*items))
+    return packed
+
+
+async def _deliver(client: Client, target: discord.abc.Messageable, send) -> None:
+    """Runs `send` with the target's webhook, recreating it once if it was deleted externally."""
+    hook = await webhook.get_webhook(client, target)
+    if hook is None:
+        return
+    try:
+        await send(hook)
+    except discord.NotFound:
+        # Webhook was deleted externally, recreate & retry once
+        webhook.invalidate(target.id)
+        hook = await webhook.get_webhook(client, target)
+        if hook is None:
+            return
+        try:
+            await send(hook)
+        except discord.HTTPException:
+            pass
+
+
+async def _send(batch: _Batch) -> None:
+    """Sends a batch, packing its views into as few webhook messages as possible."""
+    if not batch.views:
+        return
+    username = f"{batch.client.user.name} - {batch.log_type}"
+    thread = batch.thread or discord.utils.MISSING
+
+    async def send(hook: discord.Webhook) -> None:
+        for view in _pack(batch.views):
+            await hook.send(view=view, thread=thread, username=username, wait=True)
+
+    try:
+        await _deliver(batch.client, batch.target, send)
+    except discord.HTTPException:
+        pass  # A failed log must never surface as an unretrieved task exception
+
+
+async def _flush(key: tuple[int, int | None, LogType]) -> None:
+    """Sends a batch once its collection window has passed."""
+    await asyncio.sleep(_BATCH_WINDOW)
+    if (batch := _batches.pop(key, None)) is not None:
+        await _send(batch)
+
+
+def _detach(key: tuple[int, int | None, LogType]) -> _Batch | None:
+    """Removes a pending batch & cancels its timer, so later views for the destination start a new batch."""
+    batch = _batches.pop(key, None)
+    if batch is not None and batch.task:
+        batch.task.cancel()
+    return batch
+
+
+async def flush_all() -> None:
+    """Sends every pending batch right away & waits for in-flight sends, used on shutdown."""
+    batches = [_detach(key) for key in list(_batches)]
+    await asyncio.gather(*(_send(batch) for batch in batches), *_sending, return_exceptions=True)
 
 
 async def log(
@@ -54,6 +178,10 @@ async def log(
     """
     Sends a log message through the channel's single shared webhook, renamed per message to `{bot} - {log type}`.
 
+    Plain views are queued & coalesced: views for the same channel & log type that arrive within :data:`_BATCH_WINDOW`
+    seconds are packed into as few messages as Discord's component limits allow, flushing early once a message is full.
+    Logs with a file or `delete_after` are sent right away, after flushing anything queued ahead of them.
+
     Args:
         client (:class:`Client`): The bot client.
         channel (:class:`discord.abc.Messageable`): The channel to log in (threads log via their parent).
@@ -62,36 +190,44 @@ async def log(
         file (:class:`discord.File` | None): Optional file attachment, sent on its own to stay valid alongside components.
         delete_after (float | None): Seconds before the log auto-deletes.
     """
-    thread = discord.utils.MISSING
+    thread = None
     target = channel
     if isinstance(channel, discord.Thread):
         thread, target = channel, channel.parent
     if target is None:
         return
+    key = (target.id, thread.id if thread else None, log_type)
+
+    if file is None and delete_after is None:
+        if view is None:
+            return
+        batch = _batches.get(key)
+        if batch is None:
+            batch = _batches[key] = _Batch(client, target, thread, log_type)
+            batch.task = asyncio.create_task(_flush(key))
+        batch.views.append(view)
+        batch.weight += _measure(view)[0]
+        if batch.weight >= _MAX_COMPONENTS:
+            # Full message's worth queued: send now instead of waiting out the window
+            task = asyncio.create_task(_send(_detach(key)))
+            _sending.add(task)
+            task.add_done_callback(_sending.discard)
+        return
+
+    # Keep ordering: anything already queued for this destination goes out first
+    if (batch := _detach(key)) is not None:
+        await _send(batch)
 
     async def send(hook: discord.Webhook) -> None:
         username = f"{client.user.name} - {log_type}"
+        destination = thread or discord.utils.MISSING
         if file is not None:
-            msg = await hook.send(file=file, thread=thread, username=username, wait=True)
+            msg = await hook.send(file=file, thread=destination, username=username, wait=True)
             if delete_after is not None:
                 await msg.delete(delay=delete_after)
         if view is not None:
-            msg = await hook.send(view=view, thread=thread, username=username, wait=True)
+            msg = await hook.send(view=view, thread=destination, username=username, wait=True)
             if delete_after is not None:
                 await msg.delete(delay=delete_after)
 
-    hook = await webhook.get_webhook(client, target)
-    if hook is None:
-        return
-    try:
-        await send(hook)
-    except discord.NotFound:
-        # Webhook was deleted externally, recreate & retry once
-        webhook.invalidate(target.id)
-        hook = await webhook.get_webhook(client, target)
-        if hook is None:
-            return
-        try:
-            await send(hook)
-        except discord.HTTPException:
-            pass
+    await _deliver(client, target, send)
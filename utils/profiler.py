@@ -0,0 +1,74 @@
+import os
+import re
+import subprocess
+import sys
+from rich.console import Console
+from rich.table import Table
+
+report_path = "./.cache/startup_profile.txt"
+
+# One `-X importtime` line, e.g. `import time:       512 |       2048 |   rich.console`
+_importtime_rx = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+console = Console()
+
+
+def _parse(stderr: str) -> list[tuple[str, int, int, int]]:
+    """Parses `-X importtime` output into (module, self µs, cumulative µs, nesting depth) rows."""
+    rows = []
+    for line in stderr.splitlines():
+        if match := _importtime_rx.match(line):
+            own, cumulative, indent, module = match.groups()
+            rows.append((module, int(own), int(cumulative), (len(indent) - 1) // 2))
+    return rows
+
+
+def _ms(us: int) -> str:
+    return f"{us / 1000:.1f}ms"
+
+
+def profile_startup(args: list[str], top: int = 20) -> None:
+    """
+    Re-runs the bot's import path under `-X importtime` and reports per-module import cost.
+
+    The child process imports everything a normal boot would (main's imports & every eagerly loaded cog) and exits.
+    A full report sorted by self time, with cumulative cost & per top-level package totals, is written to
+    :data:`report_path`; the heaviest modules are printed.
+
+    Args:
+        args (list[str]): The script & arguments to re-run (usually `sys.argv`).
+        top (int): How many modules & packages to print.
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", *args], capture_output=True, text=True)
+    rows = _parse(result.stderr)
+    if not rows:
+        console.print("[red]✗ No import timings were recorded[/]")
+        console.print(result.stderr)
+        return
+
+    by_self = sorted(rows, key=lambda row: row[1], reverse=True)
+    packages: dict[str, int] = {}
+    for module, own, _, _ in rows:
+        package = module.split(".", 1)[0]
+        packages[package] = packages.get(package, 0) + own
+    by_package = sorted(packages.items(), key=lambda item: item[1], reverse=True)
+    total = sum(own for _, own, _, _ in rows)
+
+    os.makedirs(os.path.dirname(report_path), exist_ok=True)
+    with open(report_path, "w") as f:
+        f.write(f"Total import time: {_ms(total)} across {len(rows)} modules\n\n")
+        f.write(f"{'PACKAGE':<40} {'SELF':>10}\n")
+        f.writelines(f"{package:<40} {_ms(own):>10}\n" for package, own in by_package)
+        f.write(f"\n{'MODULE':<60} {'SELF':>10} {'CUMULATIVE':>12}\n")
+        f.writelines(f"{module:<60} {_ms(own):>10} {_ms(cumulative):>12}\n" for module, own, cumulative, _ in by_self)
+
+    modules = Table("Module", "Self", "Cumulative", box=None, header_style="green", padding=(0, 2, 0, 2))
+    for module, own, cumulative, _ in by_self[:top]:
+        modules.add_row(module, f"[cyan]{_ms(own)}[/]", f"[cyan]{_ms(cumulative)}[/]")
+    pkgs = Table("Package", "Self", box=None, header_style="green", padding=(0, 2, 0, 2))
+    for package, own in by_package[:top]:
+        pkgs.add_row(package, f"[cyan]{_ms(own)}[/]")
+    console.print(f"[green]✓ Imported [cyan]{len(rows)}[/] modules in [cyan]{_ms(total)}[/][/]")
+    console.print(pkgs)
+    console.print(modules)
+    console.print(f"  [green]╰ Full report[/]: [cyan]{report_path}[/]")
@@ -1,44 +1,133 @@
+import asyncio
 import json
 import os
+import time
 from typing import Any, Literal
 
 temp_path = "./.cache/temp.json"
 
-os.makedirs(os.path.dirname(temp_path), exist_ok=True)
-os.path.isfile(temp_path) or open(temp_path, "w").write("{}")
-try:
-    json.load(open(temp_path))
-except json.JSONDecodeError:
-    open(temp_path, "w").write("{}")
+Key = Literal["restart_msg", "player_sessions"]
 
+# In-memory view of the store, every read & write is served from here.
+# Writes are flushed to disk in the background by writing a temp file & renaming it over the store.
+_values: dict[str, Any] = {}
+_expires: dict[str, float] = {}  # Key -> unix time it expires at
+_dirty = False
+_flush_task: asyncio.Task | None = None
 
-Key = Literal["restart_msg"]
 
+def _load() -> None:
+    try:
+        with open(temp_path) as file:
+            data = json.load(file)
+    except FileNotFoundError, json.JSONDecodeError:
+        return
+    if "values" not in data:
+        data = {"values": data, "expires": {}}  # Plain key -> value file from before TTL support
+    _values.update(data["values"])
+    _expires.update(data["expires"])
 
-def get(key: Key) -> Any:
-    with open(temp_path) as file:
-        data = json.load(file)
-        return data.get(key)
 
+def _write(payload: str) -> None:
+    os.makedirs(os.path.dirname(temp_path), exist_ok=True)
+    tmp_path = f"{temp_path}.tmp"
+    with open(tmp_path, "w") as file:
+        file.write(payload)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tmp_path, temp_path)
 
-def set(key: Key, value: Any) -> Any:
-    with open(temp_path) as file:
-        data = json.load(file)
-    data[key] = value
-    with open(temp_path, "w") as file:
-        json.dump(data, file)
+
+def _dump() -> str:
+    return json.dumps({"values": _values, "expires": _expires})
+
+
+async def _flush_loop() -> None:
+    global _dirty
+    while _dirty:
+        _dirty = False
+        await asyncio.to_thread(_write, _dump())
+
+
+def _schedule() -> None:
+    """Marks the store dirty & starts a background flush, or writes right away if no event loop is running."""
+    global _dirty, _flush_task
+    _dirty = True
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        _dirty = False
+        _write(_dump())
+        return
+    if _flush_task is None or _flush_task.done():
+        _flush_task = loop.create_task(_flush_loop())
+
+
+def _expired(key: str) -> bool:
+    expires = _expires.get(key)
+    if expires is None or expires > time.time():
+        return False
+    _values.pop(key, None)
+    del _expires[key]
+    _schedule()
+    return True
+
+
+def get(key: Key, default: Any = None) -> Any:
+    """
+    Gets a value from the store.
+
+    Args:
+        key (Key): The key to get.
+        default (Any): Returned if the key is missing or expired.
+    """
+    if _expired(key):
+        return default
+    return _values.get(key, default)
+
+
+def set(key: Key, value: Any, ttl: float | None = None) -> Any:
+    """
+    Sets a value in the store. The value must be JSON serializable.
+
+    Args:
+        key (Key): The key to set.
+        value (Any): The value to store.
+        ttl (float | None): Seconds until the key expires, or None to keep it until deleted.
+    """
+    _values[key] = value
+    if ttl is None:
+        _expires.pop(key, None)
+    else:
+        _expires[key] = time.time() + ttl
+    _schedule()
     return value
 
 
 def delete(key: Key) -> None:
-    with open(temp_path) as file:
-        data = json.load(file)
-    if key in data:
-        del data[key]
-    with open(temp_path, "w") as file:
-        json.dump(data, file)
+    """
+    Deletes a key from the store.
+
+    Args:
+        key (Key): The key to delete.
+    """
+    if key in _values:
+        del _values[key]
+        _expires.pop(key, None)
+        _schedule()
 
 
 def clear() -> None:
-    with open(temp_path, "w") as file:
-        json.dump({}, file)
+    """Deletes every key from the store."""
+    _values.clear()
+    _expires.clear()
+    _schedule()
+
+
+async def flush() -> None:
+    """Waits until every pending write has reached disk. Call before the process exits or restarts."""
+    if _flush_task is not None:
+        await _flush_task
+
+
+_load()